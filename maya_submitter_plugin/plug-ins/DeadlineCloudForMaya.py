@@ -8,6 +8,7 @@ from __future__ import absolute_import, annotations, print_function
 
 import os
 import logging
+import sys
 import types
 from typing import List
 from importlib import reload
@@ -23,13 +24,35 @@ VERSION = "0.13.2"
 __log__ = logging.getLogger("Deadline")
 _registered_mel_commands: List[str] = []
 _first_initialization: bool = True
+# Packages refreshed when the plugin is loaded again, in order
+_RELOADED_PACKAGES = ("deadline.job_attachments", "deadline.client", "deadline.maya_submitter")
 
 
 def reload_modules(mod):
     """
-    Recursively reloads all modules in the specified package, in postfix order
+    Reloads all modules in the specified package, in postfix order. Each module is reloaded
+    once, even if several modules in the package import it.
     """
-    child_mods = [
+    visited = {mod.__name__}
+    # Depth first walk with an explicit stack of (module, children still to visit)
+    stack = [(mod, iter(_child_modules(mod)))]
+    while stack:
+        parent, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            __log__.debug(f"Reloading {parent}")
+            reload(parent)
+        elif child.__name__ not in visited:
+            visited.add(child.__name__)
+            stack.append((child, iter(_child_modules(child))))
+
+
+def _child_modules(mod) -> List[types.ModuleType]:
+    """
+    Returns the modules referenced by the given module that are in the same package.
+    """
+    return [
         m
         for m in mod.__dict__.values()
         if isinstance(m, types.ModuleType)
@@ -37,12 +60,6 @@ def reload_modules(mod):
         and m.__package__.startswith(mod.__package__)
     ]
 
-    for child in child_mods:
-        reload_modules(mod=child)
-
-    __log__.debug(f"Reloading {mod}")
-    reload(mod)
-
 
 def initializePlugin(plugin):
     """
@@ -50,7 +67,6 @@ def initializePlugin(plugin):
     """
     global _registered_mel_commands, _first_initialization
     try:
-        import deadline.maya_submitter
         from deadline.maya_submitter import mel_commands, shelf  # type: ignore[import, no-redef]
 
         plugin_obj = om.MFnPlugin(plugin, VENDOR, VERSION)
@@ -59,10 +75,12 @@ def initializePlugin(plugin):
             _first_initialization = False
         else:
             # If a user unloaded and then reloaded the plugin, refresh
-            # some key module dependencies.
-            reload_modules(deadline.job_attachments)
-            reload_modules(deadline.client)
-            reload_modules(deadline.maya_submitter)
+            # some key module dependencies. The submitter imports deadline.client and
+            # deadline.job_attachments when it is first opened, so they may not be loaded yet.
+            for package_name in _RELOADED_PACKAGES:
+                package = sys.modules.get(package_name)
+                if package is not None:
+                    reload_modules(package)
 
         command_name = "DeadlineCloudSubmitter"
         plugin_obj.registerCommand(command_name, mel_commands.DeadlineCloudSubmitterCmd)
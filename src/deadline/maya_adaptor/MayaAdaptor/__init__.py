@@ -1,9 +1,23 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+from typing import TYPE_CHECKING, Any
+
 from .__main__ import main
-from .adaptor import MayaAdaptor
+
+if TYPE_CHECKING:
+    from .adaptor import MayaAdaptor
 
 __all__ = [
     "MayaAdaptor",
     "main",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer loading the adaptor until it is used, so that the entry point
+    # does not pay for importing it up front.
+    if name == "MayaAdaptor":
+        from .adaptor import MayaAdaptor
+
+        return MayaAdaptor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
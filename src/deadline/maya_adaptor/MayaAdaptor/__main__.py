@@ -5,8 +5,6 @@ import sys
 
 from openjd.adaptor_runtime import EntryPoint
 
-from .adaptor import MayaAdaptor
-
 __all__ = ["main"]
 _logger = logging.getLogger(__name__)
 
@@ -14,14 +12,16 @@ _logger = logging.getLogger(__name__)
 def main(reentry_exe=None):
     _logger.info("About to start the MayaAdaptor")
 
-    package_name = vars(sys.modules[__name__])["__package__"]
+    package_name = __package__
     if not package_name:
         raise RuntimeError(f"Must be run as a module. Do not run {__file__} directly")
 
+    from .adaptor import MayaAdaptor
+
     try:
         EntryPoint(MayaAdaptor).start(reentry_exe=reentry_exe)
     except Exception as e:
-        _logger.error(f"Entrypoint failed: {e}")
+        _logger.error("Entrypoint failed: %s", e, exc_info=True)
         return 1
 
     _logger.info("Done MayaAdaptor main")
@@ -11,10 +11,10 @@ import sys
 import tempfile
 import threading
 import time
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Sequence
 
-from deadline.client.api import get_deadline_cloud_library_telemetry_client, TelemetryClient
 from openjd.adaptor_runtime._version import version as openjd_adaptor_version
 from openjd.adaptor_runtime.adaptors import Adaptor, AdaptorDataValidators, SemanticVersion
 from openjd.adaptor_runtime_client import Action
@@ -26,6 +26,9 @@ from openjd.adaptor_runtime._utils import secure_open
 
 from .._version import version as adaptor_version
 
+if TYPE_CHECKING:
+    from deadline.client.api import TelemetryClient
+
 _logger = logging.getLogger(__name__)
 
 
@@ -35,20 +38,129 @@ class MayaNotRunningError(Exception):
     pass
 
 
+# Location of maya_client.py relative to a sys.path entry
+_MAYA_CLIENT_SUFFIX = os.path.join("deadline", "maya_adaptor", "MayaClient", "maya_client.py")
+_MAYA_CLIENT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "MayaClient", "maya_client.py"
+)
 _FIRST_MAYA_ACTIONS = [
     "scene_file",
     "project_path",
 ]  # Actions which must be queued before any others
-_MAYA_INIT_KEYS = {
-    "camera",
+# Actions queued after the first actions, in this order. The scene settings come before the
+# render layer, since some renderers switch to the layer as soon as it is set, and the camera
+# comes last, since whether it is renderable depends on the layer.
+_MAYA_INIT_KEYS = (
+    "error_on_arnold_license_fail",
     "image_height",
     "image_width",
     "output_file_path",
     "output_file_prefix",
-    "render_layer",
     "render_setup_include_lights",
-    "error_on_arnold_license_fail",
-}
+    "render_layer",
+    "camera",
+)
+
+# Patterns matched against Maya's output, used by MayaAdaptor._get_regex_callbacks
+_COMPLETED_REGEXES = (re.compile("MayaClient: Finished Rendering Frame [0-9]+"),)
+_PROGRESS_REGEXES = (
+    re.compile("\\[PROGRESS\\] ([0-9]+) percent"),
+    re.compile("([0-9]+)% done"),  # arnold
+    re.compile("R90000\\s+([0-9]+)%"),  # renderman
+)
+# Patterns that start with ".*" are anchored, otherwise search() retries the ".*" from every
+# position of a line that does not match
+_ERROR_REGEXES = (re.compile("^.*(?:Exception:|Error:|Warning|SEVERE).*"),)
+_ARNOLD_LICENSE_ERROR_REGEXES = (
+    re.compile("(aborting render because the abort_on_license_fail option was enabled)"),
+)
+_RENDERMAN_LICENSE_ERROR_REGEXES = (re.compile(r"^.*{SEVERE}\s+License.*"),)
+_VRAY_LICENSE_ERROR_REGEXES = (re.compile("error: Could not obtain a license"),)
+_MAYA_LICENSE_ERROR_REGEXES = (
+    re.compile(
+        "RuntimeError: Error encountered when initializing Maya - "
+        "Please check for sufficient disk space "
+        "and necessary write permissions of MAYA_APP_DIR."
+    ),
+)
+_VERSION_REGEXES = (re.compile("MayaClient: Maya Version ([0-9]+)"),)
+
+
+class _MayaActionsQueue(ActionsQueue):
+    """
+    ActionsQueue that sets an event each time the Maya client takes an action from it.
+    """
+
+    def __init__(self, action_dequeued: threading.Event) -> None:
+        super().__init__()
+        self._action_dequeued = action_dequeued
+
+    def enqueue_actions(self, actions: list[Action]) -> None:
+        """
+        Enqueues all of the given actions, in order, at the end of the queue.
+        """
+        self._actions_queue.extend(actions)
+
+    def dequeue_action(self) -> Action | None:
+        action = super().dequeue_action()
+        if action is not None:
+            self._action_dequeued.set()
+        return action
+
+
+class _MayaRegexHandler(RegexHandler):
+    """
+    RegexHandler that first tests each line against a single alternation of every callback's
+    patterns. Most of Maya's output matches none of them, and those lines are skipped with one
+    search instead of one search per pattern.
+    """
+
+    def __init__(self, regex_callbacks: Sequence[RegexCallback], level: int = logging.NOTSET):
+        super().__init__(regex_callbacks, level)
+        self._any_regex = re.compile(
+            "|".join(
+                f"(?:{regex.pattern})"
+                for regex_callback in self.regex_callbacks
+                for regex in regex_callback.regex_list
+            )
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._any_regex.search(record.msg):
+            super().emit(record)
+
+
+@lru_cache(maxsize=None)
+def _get_maya_client_path() -> str:
+    """
+    Obtains the maya_client.py path, preferring the copy installed alongside this adaptor and
+    otherwise searching directories in sys.path. The result is cached for the process.
+
+    Raises:
+        FileNotFoundError: If the maya_client.py file could not be found.
+
+    Returns:
+        str: The path to the maya_client.py file.
+    """
+    if os.path.isfile(_MAYA_CLIENT_PATH):
+        return _MAYA_CLIENT_PATH
+    for dir_ in sys.path:
+        path = os.path.join(dir_, _MAYA_CLIENT_SUFFIX)
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(
+        "Could not find maya_client.py. Check that the MayaClient package is in one of the "
+        f"following directories: {sys.path[1:]}"
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_validators(schema_dir: str) -> AdaptorDataValidators:
+    """
+    Returns the init and run data validators for the schemas in schema_dir. The schemas are
+    read and compiled the first time a directory is requested and reused afterwards.
+    """
+    return AdaptorDataValidators.for_adaptor(schema_dir)
 
 
 def _check_for_exception(func: Callable) -> Callable:
@@ -73,28 +185,50 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
     _SERVER_END_TIMEOUT_SECONDS = 30
     _MAYA_START_TIMEOUT_SECONDS = 86400
     _MAYA_END_TIMEOUT_SECONDS = 30
+    # Upper bound on how long to wait for a state change before re-checking that Maya is alive
+    _MAYA_POLL_INTERVAL_SECONDS = 1
 
     _server: AdaptorServer | None = None
     _server_thread: threading.Thread | None = None
     _maya_client: LoggingSubprocess | None = None
-    _action_queue = ActionsQueue()
+    _action_queue: _MayaActionsQueue
     _is_rendering: bool = False
     _arnold_temp_dir: tempfile.TemporaryDirectory | None = None
     # If a thread raises an exception we will update this to raise in the main thread
     _exc_info: Exception | None = None
+    # The Maya license error, built on its first occurrence and reused when Maya repeats it
+    _license_error: Exception | None = None
     _performing_cleanup = False
     _maya_version: str = ""
     _telemetry_client: TelemetryClient | None = None
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Set when the adaptor server is ready to accept connections
+        self._socket_ready = threading.Event()
+        # Set whenever the Maya client dequeues an action, finishes a render or hits an error
+        self._maya_state_changed = threading.Event()
+        self._action_queue = _MayaActionsQueue(self._maya_state_changed)
+
     @property
     def integration_data_interface_version(self) -> SemanticVersion:
         return SemanticVersion(major=0, minor=1)
 
     @staticmethod
-    def _get_timer(timeout: int | float) -> Callable[[], bool]:
-        """Given a timeout length, returns a lambda which returns True until the timeout occurs"""
-        timeout_time = time.time() + timeout
-        return lambda: time.time() < timeout_time
+    def _get_deadline(timeout: int | float) -> float:
+        """
+        Given a timeout length, returns the time.monotonic() value at which the timeout occurs.
+        The monotonic clock is not affected by changes to the system clock.
+        """
+        return time.monotonic() + timeout
+
+    @cached_property
+    def _path_mapping_pairs(self) -> list[tuple[str, str]]:
+        """
+        The (source, destination) path of each path mapping rule, in order. The rules do not
+        change over the life of the adaptor, so they are only read once.
+        """
+        return [(rule.source_path, rule.destination_path) for rule in self.path_mapping_rules]
 
     @property
     def _has_exception(self) -> bool:
@@ -137,10 +271,23 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         """
         self._is_rendering = value
 
+    def _wait_for_maya(self, timeout: float | None = None) -> None:
+        """
+        Blocks until the Maya client signals a change in state, or until the timeout (capped at
+        the poll interval) elapses, whichever comes first.
+
+        Args:
+            timeout (float, optional): The longest time to wait for, in seconds.
+        """
+        if timeout is None or timeout > self._MAYA_POLL_INTERVAL_SECONDS:
+            timeout = self._MAYA_POLL_INTERVAL_SECONDS
+        self._maya_state_changed.wait(timeout)
+        self._maya_state_changed.clear()
+
     def _wait_for_socket(self) -> str:
         """
-        Performs a busy wait for the socket path that the adaptor server is running on, then
-        returns it.
+        Waits for the adaptor server to signal that it is ready, then returns the socket path
+        that it is running on.
 
         Raises:
             RuntimeError: If the server does not finish initializing
@@ -148,9 +295,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         Returns:
             str: The socket path the adaptor server is running on.
         """
-        is_not_timed_out = self._get_timer(self._SERVER_START_TIMEOUT_SECONDS)
-        while (self._server is None or self._server.server_path is None) and is_not_timed_out():
-            time.sleep(0.01)
+        self._socket_ready.wait(self._SERVER_START_TIMEOUT_SECONDS)
 
         if self._server is not None and self._server.server_path is not None:
             return self._server.server_path
@@ -165,6 +310,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         forever in a blocking call.
         """
         self._server = AdaptorServer(self._action_queue, self)
+        self._socket_ready.set()
         self._server.serve_forever()
 
     def _start_maya_server_thread(self) -> None:
@@ -188,53 +334,21 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         Returns:
             list[RegexCallback]: List of Regex Callbacks to add
         """
-        _maya_license_error = (
-            "RuntimeError: Error encountered when initializing Maya - "
-            "Please check for sufficient disk space "
-            "and necessary write permissions of MAYA_APP_DIR."
-        )
-        _vray_license_error = "error: Could not obtain a license"
-        _renderman_license_error = ".*{SEVERE}\s+License.*"
         callback_list = []
-        completed_regexes = [re.compile("MayaClient: Finished Rendering Frame [0-9]+")]
-        progress_regexes = [
-            re.compile("\\[PROGRESS\\] ([0-9]+) percent"),
-            re.compile("([0-9]+)% done"),  # arnold
-            re.compile("R90000\\s+([0-9]+)%"),  # renderman
-        ]
-        error_regexes = [re.compile(".*Exception:.*|.*Error:.*|.*Warning.*|.*SEVERE.*")]
-        version_regexes = [re.compile("MayaClient: Maya Version ([0-9]+)")]
-
-        callback_list.append(RegexCallback(completed_regexes, self._handle_complete))
-        callback_list.append(RegexCallback(progress_regexes, self._handle_progress))
+        callback_list.append(RegexCallback(_COMPLETED_REGEXES, self._handle_complete))
+        callback_list.append(RegexCallback(_PROGRESS_REGEXES, self._handle_progress))
         if self.init_data.get("strict_error_checking", False):
-            callback_list.append(RegexCallback(error_regexes, self._handle_error))
+            callback_list.append(RegexCallback(_ERROR_REGEXES, self._handle_error))
         if self.init_data.get("error_on_arnold_license_fail", False):
-            callback_list.append(
-                RegexCallback(
-                    [
-                        re.compile(
-                            "(aborting render because the abort_on_license_fail option was enabled)"
-                        )
-                    ],
-                    self._handle_error,
-                )
-            )
+            callback_list.append(RegexCallback(_ARNOLD_LICENSE_ERROR_REGEXES, self._handle_error))
         callback_list.append(
-            RegexCallback(
-                [re.compile(_renderman_license_error)], self._handle_renderman_license_error
-            )
-        )
-        callback_list.append(
-            RegexCallback([re.compile(_vray_license_error)], self._handle_vray_license_error)
+            RegexCallback(_RENDERMAN_LICENSE_ERROR_REGEXES, self._handle_renderman_license_error)
         )
         callback_list.append(
-            RegexCallback(
-                [re.compile(_maya_license_error)],
-                self._handle_license_error,
-            )
+            RegexCallback(_VRAY_LICENSE_ERROR_REGEXES, self._handle_vray_license_error)
         )
-        callback_list.append(RegexCallback(version_regexes, self._handle_maya_version))
+        callback_list.append(RegexCallback(_MAYA_LICENSE_ERROR_REGEXES, self._handle_license_error))
+        callback_list.append(RegexCallback(_VERSION_REGEXES, self._handle_maya_version))
 
         return callback_list
 
@@ -246,6 +360,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
             match (re.Match): The match object from the regex pattern that was matched the message
         """
         self._maya_is_rendering = False
+        self._maya_state_changed.set()
         self.update_status(progress=100)
 
     @_check_for_exception
@@ -268,6 +383,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
             RuntimeError: Always raises a runtime error to halt the adaptor.
         """
         self._exc_info = RuntimeError(f"Maya Encountered an Error: {match.group(0)}")
+        self._maya_state_changed.set()
 
     def _handle_license_error(self, match: re.Match) -> None:
         """
@@ -278,17 +394,22 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         Raises:
             RuntimeError: Always raises a runtime error to halt the adaptor.
         """
-        license_file = os.environ.get("ADSKFLEX_LICENSE_FILE")
-        maya_app_dir = os.environ.get("MAYA_APP_DIR")
-        shutil_usage = shutil.disk_usage(maya_app_dir or os.getcwd())
-        self._exc_info = RuntimeError(
-            f"{match.group(0)}\n"
-            "This error is typically associated with a licensing error"
-            " when using MayaIO. Check your licensing configuration.\n"
-            f"Free disc space: {shutil_usage.free//1024//1024}M\n"
-            f"MAYA_APP_DIR: {maya_app_dir}\n"
-            f"ADSKFLEX_LICENSE_FILE: {license_file}"
-        )
+        if self._license_error is None:
+            # Maya often repeats this line; only probe the disk for the first one
+            license_file = os.environ.get("ADSKFLEX_LICENSE_FILE")
+            maya_app_dir = os.environ.get("MAYA_APP_DIR")
+            shutil_usage = shutil.disk_usage(maya_app_dir or os.getcwd())
+            self._license_error = RuntimeError(
+                f"{match.group(0)}\n"
+                "This error is typically associated with a licensing error"
+                " when using MayaIO. Check your licensing configuration.\n"
+                f"Free disc space: {shutil_usage.free//1024//1024}M\n"
+                f"MAYA_APP_DIR: {maya_app_dir}\n"
+                f"ADSKFLEX_LICENSE_FILE: {license_file}"
+            )
+        # Always set it, since the strict error checking callback also matches this line
+        self._exc_info = self._license_error
+        self._maya_state_changed.set()
 
     def _handle_vray_license_error(self, match: re.Match) -> None:
         """
@@ -305,6 +426,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
             " when using Vray renderer with MayaIO."
             " Check your licensing configuration.\n"
         )
+        self._maya_state_changed.set()
 
     def _handle_renderman_license_error(self, match: re.Match) -> None:
         """
@@ -324,6 +446,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
             f"RMANTREE: {rmantree}\n"
             f"PIXAR_LICENSE_FILE: {pixar_license_file}\n"
         )
+        self._maya_state_changed.set()
 
     def _handle_maya_version(self, match: re.Match) -> None:
         """
@@ -336,7 +459,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
     @property
     def maya_client_path(self) -> str:
         """
-        Obtains the maya_client.py path by searching directories in sys.path
+        Obtains the maya_client.py path, see _get_maya_client_path.
 
         Raises:
             FileNotFoundError: If the maya_client.py file could not be found.
@@ -344,14 +467,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         Returns:
             str: The path to the maya_client.py file.
         """
-        for dir_ in sys.path:
-            path = os.path.join(dir_, "deadline", "maya_adaptor", "MayaClient", "maya_client.py")
-            if os.path.isfile(path):
-                return path
-        raise FileNotFoundError(
-            "Could not find maya_client.py. Check that the MayaClient package is in one of the "
-            f"following directories: {sys.path[1:]}"
-        )
+        return _get_maya_client_path()
 
     def _start_maya_client(self) -> None:
         """
@@ -363,7 +479,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
             FileNotFoundError: If the maya_client.py file could not be found.
         """
         mayapy_exe = "mayapy"
-        regexhandler = RegexHandler(self._get_regex_callbacks())
+        regexhandler = _MayaRegexHandler(self._get_regex_callbacks())
 
         # Add the openjd namespace directory to PYTHONPATH, so that adaptor_runtime_client
         # will be available directly to the adaptor client.
@@ -374,13 +490,12 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
             os.path.dirname(openjd.adaptor_runtime_client.__file__)
         )
         deadline_namespace_dir = os.path.dirname(os.path.dirname(deadline.maya_adaptor.__file__))
-        python_path_addition = f"{openjd_namespace_dir}{os.pathsep}{deadline_namespace_dir}"
-        if "PYTHONPATH" in os.environ:
-            os.environ["PYTHONPATH"] = (
-                f"{os.environ['PYTHONPATH']}{os.pathsep}{python_path_addition}"
-            )
-        else:
-            os.environ["PYTHONPATH"] = python_path_addition
+        # Empty entries are dropped, since Python treats them as the current directory
+        python_paths = [path for path in os.environ.get("PYTHONPATH", "").split(os.pathsep) if path]
+        for path in (openjd_namespace_dir, deadline_namespace_dir):
+            if path not in python_paths:
+                python_paths.append(path)
+        os.environ["PYTHONPATH"] = os.pathsep.join(python_paths)
 
         if self.init_data["renderer"] == "arnold":
             self._setup_arnold_pathmapping()
@@ -395,32 +510,32 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         """
         Populates the adaptor server's action queue with actions from the init_data that the Maya
         Client will request and perform. The action must be present in the _FIRST_MAYA_ACTIONS or
-        _MAYA_INIT_KEYS set to be added to the action queue.
+        _MAYA_INIT_KEYS to be added to the action queue.
         """
 
         # Set up the renderer
-        self._action_queue.enqueue_action(
-            Action("renderer", {"renderer": self.init_data["renderer"]})
-        )
+        actions = [Action("renderer", {"renderer": self.init_data["renderer"]})]
 
         # Set up all pathmapping rules
-        self._action_queue.enqueue_action(
+        actions.append(
             Action(
                 "path_mapping",
                 {
                     "path_mapping_rules": {
-                        rule.source_path: rule.destination_path for rule in self.path_mapping_rules
+                        source: destination for source, destination in self._path_mapping_pairs
                     }
                 },
             )
         )
 
         for action_name in _FIRST_MAYA_ACTIONS:
-            self._action_queue.enqueue_action(self._action_from_action_item(action_name))
+            actions.append(self._action_from_action_item(action_name))
 
         for action_name in _MAYA_INIT_KEYS:
             if action_name in self.init_data:
-                self._action_queue.enqueue_action(self._action_from_action_item(action_name))
+                actions.append(self._action_from_action_item(action_name))
+
+        self._action_queue.enqueue_actions(actions)
 
     def on_start(self) -> None:
         """
@@ -435,7 +550,7 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         """
         cur_dir = os.path.dirname(__file__)
         schema_dir = os.path.join(cur_dir, "schemas")
-        validators = AdaptorDataValidators.for_adaptor(schema_dir)
+        validators = _get_validators(schema_dir)
         validators.init_data.validate(self.init_data)
 
         self.update_status(progress=0, status_message="Initializing Maya")
@@ -444,21 +559,22 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
 
         self._start_maya_client()
 
-        is_not_timed_out = self._get_timer(self._MAYA_START_TIMEOUT_SECONDS)
+        deadline = self._get_deadline(self._MAYA_START_TIMEOUT_SECONDS)
         while (
             self._maya_is_running
             and not self._has_exception
             and len(self._action_queue) > 0
-            and is_not_timed_out()
+            and time.monotonic() < deadline
         ):
-            time.sleep(0.1)  # busy wait for maya to finish initialization
+            # Wait for maya to finish initialization
+            self._wait_for_maya(deadline - time.monotonic())
 
         self._get_deadline_telemetry_client().record_event(
             event_type="com.amazon.rum.deadline.adaptor.runtime.start", event_details={}
         )
 
         if len(self._action_queue) > 0:
-            if is_not_timed_out():
+            if time.monotonic() < deadline:
                 raise RuntimeError(
                     "Maya encountered an error and was not able to complete initialization actions."
                 )
@@ -478,12 +594,12 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
 
         cur_dir = os.path.dirname(__file__)
         schema_dir = os.path.join(cur_dir, "schemas")
-        validators = AdaptorDataValidators.for_adaptor(schema_dir)
+        validators = _get_validators(schema_dir)
         validators.run_data.validate(run_data)
         self._maya_is_rendering = True
         self._action_queue.enqueue_action(Action("start_render", run_data))
         while self._maya_is_rendering and not self._has_exception:
-            time.sleep(0.1)  # wait for the render to finish
+            self._wait_for_maya()  # wait for the render to finish
 
         if not self._maya_is_running and self._maya_client:  # Maya Client will always exist here.
             #  This is always an error case because the Maya Client should still be running and
@@ -510,8 +626,8 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         self._performing_cleanup = True
 
         self._action_queue.enqueue_action(Action("close"), front=True)
-        is_not_timed_out = self._get_timer(self._MAYA_END_TIMEOUT_SECONDS)
-        while self._maya_is_running and is_not_timed_out():
+        deadline = self._get_deadline(self._MAYA_END_TIMEOUT_SECONDS)
+        while self._maya_is_running and time.monotonic() < deadline:
             time.sleep(0.1)
         if self._maya_is_running and self._maya_client:
             _logger.error(
@@ -579,16 +695,18 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
 
         arnold_pathmapping_rules = {
             get_arnold_osname(): {
-                rule.source_path.replace("\\", "/"): rule.destination_path.replace("\\", "/")
-                for rule in self.path_mapping_rules
+                source.replace("\\", "/"): destination.replace("\\", "/")
+                for source, destination in self._path_mapping_pairs
             }
         }
 
         self._arnold_temp_dir = tempfile.TemporaryDirectory(prefix="arnold")  # 0o700
         arnold_pathmapping_file = Path(self._arnold_temp_dir.name) / "arnold_pathmapping.json"
 
+        # Serialized up front so the file is written in a single call
+        payload = json.dumps(arnold_pathmapping_rules, separators=(",", ":"))
         with secure_open(arnold_pathmapping_file, open_mode="w") as json_file:
-            json.dump(arnold_pathmapping_rules, json_file)
+            json_file.write(payload)
 
         os.environ["ARNOLD_PATHMAP"] = str(arnold_pathmapping_file)
 
@@ -605,6 +723,9 @@ class MayaAdaptor(Adaptor[AdaptorConfiguration]):
         Wrapper around the Deadline Client Library telemetry client, in order to set package-specific information
         """
         if not self._telemetry_client:
+            # Imported here since it pulls in boto3, which the adaptor's frontend commands never use
+            from deadline.client.api import get_deadline_cloud_library_telemetry_client
+
             self._telemetry_client = get_deadline_cloud_library_telemetry_client()
             self._telemetry_client.update_common_details(
                 {
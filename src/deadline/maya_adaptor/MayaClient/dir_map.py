@@ -32,24 +32,30 @@ class DirectoryMappingDict(object):
     def __contains__(self, source: str):
         return maya.cmds.dirmap(getMappedDirectory=source) is not None
 
+    def _all_mappings(self) -> List[str]:
+        """
+        Returns the flat [source, dest, source, dest, ...] list of every mapping
+        """
+        return maya.cmds.dirmap(getAllMappings=True) or []
+
     def items(self) -> List[Tuple[str, str]]:
         """
         Returns a list containing all mapping pairs
         """
-        all_mappings = maya.cmds.dirmap(getAllMappings=True)
-        return list(zip(all_mappings[::2], all_mappings[1::]))
+        all_mappings = iter(self._all_mappings())
+        return list(zip(all_mappings, all_mappings))
 
     def keys(self) -> List[str]:
         """
         Returns a list containing all source paths.
         """
-        return maya.cmds.dirmap(getAllMappings=True)[::2]
+        return self._all_mappings()[::2]
 
     def values(self) -> List[str]:
         """
         Returns a list of all output paths
         """
-        return maya.cmds.dirmap(getAllMappings=True)[1::2]
+        return self._all_mappings()[1::2]
 
     def get(self, item, default=None) -> Optional[str]:
         try:
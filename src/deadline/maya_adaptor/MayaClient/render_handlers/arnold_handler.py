@@ -15,6 +15,8 @@ class ArnoldHandler(DefaultMayaHandler):
         super().__init__()
         self.action_dict["error_on_arnold_license_fail"] = self.set_error_on_arnold_license_fail
         self.render_kwargs["batch"] = True
+        # Whether the render options have been set since the scene was opened
+        self._render_options_set = False
 
     def start_render(self, data: dict) -> None:
         """
@@ -46,6 +48,17 @@ class ArnoldHandler(DefaultMayaHandler):
                 flush=True,
             )
 
+        if not self._render_options_set:
+            self._set_render_options()
+
+        maya.cmds.arnoldRender(**self.render_kwargs)
+        print(f"MayaClient: Finished Rendering Frame {frame}\n", flush=True)
+
+    def _set_render_options(self) -> None:
+        """
+        Sets the Arnold render options every frame needs. These live in the scene, so they only
+        need to be set once after the scene is opened.
+        """
         # Set the arnold render type so that we don't just make .ass files, but the actual image
         maya.cmds.setAttr("defaultArnoldRenderOptions.renderType", 0)
 
@@ -53,8 +66,17 @@ class ArnoldHandler(DefaultMayaHandler):
         if maya.cmds.getAttr("defaultArnoldRenderOptions.log_verbosity") < 2:
             maya.cmds.setAttr("defaultArnoldRenderOptions.log_verbosity", 2)
 
-        maya.cmds.arnoldRender(**self.render_kwargs)
-        print(f"MayaClient: Finished Rendering Frame {frame}\n", flush=True)
+        self._render_options_set = True
+
+    def set_scene_file(self, data: dict) -> None:
+        """
+        Opens a scene file in maya. The render options are set again for the new scene.
+
+        Args:
+            data (dict): The data given from the Adaptor. Keys expected: ['scene_file']
+        """
+        super().set_scene_file(data)
+        self._render_options_set = False
 
     def set_error_on_arnold_license_fail(self, data: dict) -> None:
         """
@@ -81,6 +103,7 @@ class ArnoldHandler(DefaultMayaHandler):
         render_layer_name = self.get_render_layer_to_render(data)
         if render_layer_name:
             maya.cmds.editRenderLayerGlobals(currentRenderLayer=render_layer_name)
+            self._clear_validated_camera()
 
     def set_image_height(self, data: dict) -> None:
         """
@@ -35,40 +35,56 @@ class DefaultMayaHandler:
         }
         self.camera_name = None
         self.render_kwargs = {}
+        # The camera get_camera_to_render last validated. Every frame renders with the same scene,
+        # camera and render layer, so the camera is only checked again after one of them changes.
+        self._validated_camera: Optional[str] = None
 
     def get_camera_to_render(self, data: dict) -> list[str]:
-        # The ls function returns all of the camera shapes, but the cameras themselves are represented by
-        # the transform node which is the parent of the shape.
-        camera_shape_names = maya.cmds.ls(cameras=True)
-        camera_names = maya.cmds.listRelatives(camera_shape_names, parent=True)
-
         camera_name = data.get("camera", self.camera_name)
-        if camera_name:
-            if camera_name not in camera_names:
-                raise RuntimeError(f"The specified camera, '{camera_name}', does not exist.")
+        if camera_name and camera_name == self._validated_camera:
+            return camera_name
 
-            if not maya.cmds.getAttr(f"{camera_name}.renderable"):
-                raise RuntimeError(f"The specified camera, '{camera_name}', is not renderable.")
-        else:
+        if not camera_name:
             raise RuntimeError("No cameras was specified to render.")
 
+        # Cameras are represented by the transform node which is the parent of the camera shape.
+        # Resolve the name directly instead of listing every camera in the scene; it must match
+        # exactly one transform that has a camera shape.
+        matches = maya.cmds.ls(camera_name, transforms=True)
+        # listRelatives returns None rather than an empty list when nothing matches
+        if len(matches) != 1 or not maya.cmds.listRelatives(matches[0], shapes=True, type="camera"):
+            raise RuntimeError(f"The specified camera, '{camera_name}', does not exist.")
+
+        if not maya.cmds.getAttr(f"{camera_name}.renderable"):
+            raise RuntimeError(f"The specified camera, '{camera_name}', is not renderable.")
+
+        self._validated_camera = camera_name
         return camera_name
 
+    def _clear_validated_camera(self) -> None:
+        """
+        Makes the next get_camera_to_render call check the camera again. Called whenever the scene,
+        camera or render layer changes.
+        """
+        self._validated_camera = None
+
     def get_render_layer_to_render(self, data: dict) -> Optional[str]:
         display_name = data.get("render_layer")
         if display_name:
-            render_layer_map = {
-                _get_render_layer_display_name(name): name
-                for name in maya.cmds.ls(type="renderLayer")
-                if not maya.cmds.referenceQuery(name, isNodeReferenced=True)
-            }
-            if display_name in render_layer_map:
-                return render_layer_map[display_name]
-            else:
-                raise RuntimeError(
-                    f"Error: Render layer '{display_name}' not found. Available render layers are: "
-                    f"{sorted(render_layer_map.keys())}"
-                )
+            # Stop at the matching layer, the display names of every layer are only needed to
+            # report that the layer was not found
+            layer_display_names = []
+            for name in maya.cmds.ls(type="renderLayer"):
+                if maya.cmds.referenceQuery(name, isNodeReferenced=True):
+                    continue
+                layer_display_name = _get_render_layer_display_name(name)
+                if layer_display_name == display_name:
+                    return name
+                layer_display_names.append(layer_display_name)
+            raise RuntimeError(
+                f"Error: Render layer '{display_name}' not found. Available render layers are: "
+                f"{sorted(layer_display_names)}"
+            )
         else:
             return None
 
@@ -108,6 +124,7 @@ class DefaultMayaHandler:
             RuntimeError: If the camera is not renderable or does not exist
         """
         self.camera_name = data.get("camera")
+        self._clear_validated_camera()
 
     def set_image_height(self, data: dict) -> None:
         """
@@ -194,6 +211,7 @@ class DefaultMayaHandler:
         render_layer_name = self.get_render_layer_to_render(data)
         if render_layer_name:
             self.render_kwargs["layer"] = render_layer_name
+            self._clear_validated_camera()
 
     def set_render_setup_include_lights(self, data: dict) -> None:
         """
@@ -218,7 +236,9 @@ class DefaultMayaHandler:
         file_path = data.get("scene_file", "")
         if not os.path.isfile(file_path):
             raise FileNotFoundError(f"The scene file '{file_path}' does not exist")
-        maya.cmds.file(file_path, open=True, force=True)
+        # Never wait on a dialog, such as the one for a scene saved by another Maya version
+        maya.cmds.file(file_path, open=True, force=True, prompt=False)
+        self._clear_validated_camera()
 
         pre_render_mel = maya.cmds.getAttr("defaultRenderGlobals.preMel")
         if pre_render_mel:
@@ -28,6 +28,7 @@ class RenderManHandler(DefaultMayaHandler):
         rl = self.get_render_layer_to_render(data)
         if rl:
             self.render_layer = rl
+            self._clear_validated_camera()
 
     def set_image_height(self, data: dict) -> None:
         """
@@ -3,18 +3,28 @@ from __future__ import annotations
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Iterable
+from typing import Optional, Sequence
 
 from .file_path_editor import FilePathEditor
 from .scene import Animation, RendererNames, Scene
 from .utils import findAllFilesForPattern
 
 _FRAME_RE = re.compile("#+")
+# Metadata files that erroneously match a path's pattern
+_EXCLUDED_SUFFIXES = (":Zone.Identifier",)
+# Upper bound on the threads used to search for the frames of animated paths
+_EXPAND_PATH_MAX_WORKERS = 16
 
 
 class AssetIntrospector:
+    # The scene's render frames, read from Maya when the first animated path is expanded
+    _scene_frames: Optional[tuple[int, ...]] = None
+    # Searches the frames of animated paths, shared by every path expanded during a parse
+    _executor: Optional[ThreadPoolExecutor] = None
+
     def parse_scene_assets(self) -> set[Path]:
         """
         Searches the scene for assets, and filters out assets that are not needed for Rendering.
@@ -24,27 +34,44 @@ class AssetIntrospector:
         """
         # clear filesystem cache from last run
         self._expand_path.cache_clear()
+        self._scene_frames = None
+
+        # The pool only starts threads once an animated path is searched, so a scene without
+        # any does not pay for them
+        with ThreadPoolExecutor(_EXPAND_PATH_MAX_WORKERS) as executor:
+            self._executor = executor
+            try:
+                return self._parse_scene_assets()
+            finally:
+                self._executor = None
+
+    def _parse_scene_assets(self) -> set[Path]:
+        """
+        Collects the assets for parse_scene_assets, once the search state has been reset.
+        """
         # Grab tx files (if we need to)
         assets: set[Path] = set()
 
         # Grab any yeti files
         assets.update(self._get_yeti_files())
 
-        if Scene.renderer() == RendererNames.arnold.value:
+        renderer = Scene.renderer()
+        if renderer == RendererNames.arnold.value:
             assets.update(self._get_tx_files())
-        elif Scene.renderer() == RendererNames.renderman.value:
+        elif renderer == RendererNames.renderman.value:
             assets.update(self._get_tex_files())
 
+        # Normalized paths of the file references already searched for
+        seen_paths: set[str] = set()
         for ref in FilePathEditor.fileRefs():
             normalized_path = os.path.normpath(ref.path)
-            # Files without tokens may already have been checked, if so, skip
-            if normalized_path in assets:
+            # Several nodes may reference the same file, if so, skip
+            if normalized_path in seen_paths:
                 continue
+            seen_paths.add(normalized_path)
             # Files with tokens may have already been checked when grabbing arnold's tx files.
-            # Since the expand path returns a generator, it'll actually skip rechecking
-            # these files since it returns the original generator which is exhausted.
-            for path in self._expand_path(normalized_path):
-                assets.add(path)
+            # The expanded paths are cached, so those files are not searched for again.
+            assets.update(self._expand_path(normalized_path))
 
         assets.add(Path(Scene.name()))
 
@@ -132,8 +159,17 @@ class AssetIntrospector:
 
         return mtoa.get_scanned_files(mtoa.scene_default_texture_scan)
 
+    def _get_scene_frames(self) -> tuple[int, ...]:
+        """
+        Returns the frames the scene renders. They are read from Maya once, and reused for every
+        animated path until the next parse.
+        """
+        if self._scene_frames is None:
+            self._scene_frames = tuple(Animation.frame_list())
+        return self._scene_frames
+
     @lru_cache(maxsize=None)
-    def _expand_path(self, path: str) -> Generator[Path, None, None]:
+    def _expand_path(self, path: str) -> tuple[Path, ...]:
         """
         Some animated textures are padded with multiple '#' characters to indicate the current frame
         number, while others such as animated multi-tiled UV textures will have tokens such as <f>,
@@ -143,27 +179,36 @@ class AssetIntrospector:
         required at render time.
 
         This function gets called for a varierty of file groupings (ie. Arnold's txmanager, Maya's FilePathEditor)
-        Since this func has an lru cache and returns a generator, it'll actually skip rechecking these files since
-        it returns the original generator which is exhausted. You can, however, force it to recheck
+        Since this func has an lru cache, the filesystem is only searched the first time a path is expanded,
+        and later calls return the same paths. You can, however, force it to recheck
         these files by performing asset_introspector._expand_path.cache_clear() call.
 
         Args:
             path (str): A path with tokens to replace
 
-        Yields:
-            Generator[str, None, None]: A series of paths that match the pattern provided.
+        Returns:
+            tuple[Path, ...]: The paths that match the pattern provided.
         """
-        frame_re_matches = _FRAME_RE.findall(path)
-
-        frame_list: Iterable[int] = [0]
-        if frame_re_matches or "<f>" in path:
-            frame_list = Animation.frame_list()
-
-        for frame in frame_list:
-            working_path = path
-            for group in frame_re_matches:
-                working_path = working_path.replace(group, str(frame).zfill(len(group)))
-            paths = findAllFilesForPattern(working_path, frame)
-            for p in paths:
-                if not p.endswith(":Zone.Identifier"):  # Metadata files that erroneously match
-                    yield Path(p)
+        # Turn each run of '#' into a zero padded format field once, e.g. "tex.###.png" becomes
+        # "tex.{0:03d}.png", so that each frame's path is built with a single format call.
+        path_template, padding_count = _FRAME_RE.subn(
+            lambda match: f"{{0:0{len(match.group())}d}}",
+            path.replace("{", "{{").replace("}", "}}"),
+        )
+
+        frames: Sequence[int] = [0]
+        if padding_count or "<f>" in path:
+            frames = self._get_scene_frames()
+
+        working_paths = [path_template.format(frame) if padding_count else path for frame in frames]
+
+        if len(frames) > 1 and self._executor is not None:
+            # Each frame's search is bound by filesystem calls, which release the GIL, so the
+            # frames are searched concurrently. map keeps the results in frame order.
+            results = list(self._executor.map(findAllFilesForPattern, working_paths, frames))
+        else:
+            results = list(map(findAllFilesForPattern, working_paths, frames))
+
+        return tuple(
+            Path(p) for paths in results for p in paths if not p.endswith(_EXCLUDED_SUFFIXES)
+        )
@@ -10,22 +10,40 @@ Functionality for interacting with Cameras in a Maya scene.
 ALL_CAMERAS = "All Cameras"
 
 
-def get_renderable_camera_names() -> list[str]:
+def _get_camera_names() -> list[str]:
     """
-    Returns a list of all camera objects in the scene that are marked as renderable.
+    Returns a list of all camera objects in the scene.
     """
     # The ls function returns all of the camera shapes, but the cameras themselves are represented by
     # the transform node which is the parent of the shape.
     camera_shape_names = maya.cmds.ls(cameras=True)
-    camera_names = maya.cmds.listRelatives(camera_shape_names, parent=True)
+    return maya.cmds.listRelatives(camera_shape_names, parent=True) or []
 
+
+def get_renderable_camera_names() -> list[str]:
+    """
+    Returns a list of all camera objects in the scene that are marked as renderable.
+    """
     return [
         camera_name
-        for camera_name in camera_names
+        for camera_name in _get_camera_names()
         if maya.cmds.getAttr(f"{camera_name}.renderable")
     ]
 
 
+def has_multiple_renderable_cameras() -> bool:
+    """
+    Returns True if more than one camera in the scene is marked as renderable. Stops checking
+    cameras as soon as a second renderable one is found.
+    """
+    renderable_cameras = (
+        camera_name
+        for camera_name in _get_camera_names()
+        if maya.cmds.getAttr(f"{camera_name}.renderable")
+    )
+    return next(renderable_cameras, None) is not None and next(renderable_cameras, None) is not None
+
+
 def is_camera_renderable(camera_name) -> bool:
     """
     Returns True if this camera is renderable.
@@ -50,14 +50,9 @@ class RenderSubmitterUISettings:
                     sticky_settings = json.load(fh)
 
                 if isinstance(sticky_settings, dict):
-                    sticky_fields = {
-                        field.name: field
-                        for field in dataclasses.fields(self)
-                        if field.metadata.get("sticky")
-                    }
                     for name, value in sticky_settings.items():
                         # Only set fields that are defined in the dataclass
-                        if name in sticky_fields:
+                        if name in _STICKY_FIELD_NAMES:
                             setattr(self, name, value)
             except (OSError, json.JSONDecodeError):
                 # If something bad happened to the sticky settings file,
@@ -75,9 +70,13 @@ class RenderSubmitterUISettings:
             RENDER_SUBMITTER_SETTINGS_FILE_EXT
         )
         with open(sticky_settings_filename, "w", encoding="utf8") as fh:
-            obj = {
-                field.name: getattr(self, field.name)
-                for field in dataclasses.fields(self)
-                if field.metadata.get("sticky")
-            }
+            obj = {name: getattr(self, name) for name in _STICKY_FIELD_NAMES}
             json.dump(obj, fh, indent=1)
+
+
+# The names of the settings saved next to the scene, in field order
+_STICKY_FIELD_NAMES = tuple(
+    field.name
+    for field in dataclasses.fields(RenderSubmitterUISettings)
+    if field.metadata.get("sticky")
+)
@@ -4,7 +4,6 @@ from __future__ import annotations
 import os
 
 from dataclasses import dataclass
-from distutils.util import strtobool
 from typing import Optional
 
 import maya.cmds
@@ -14,6 +13,24 @@ Module contain a wrapper around Maya's filepatheditor mel command
 """
 
 
+# The truth values distutils.util.strtobool accepted. The file path editor reports whether each
+# file exists as one of them.
+_TRUTH_VALUES = {
+    **dict.fromkeys(("y", "yes", "t", "true", "on", "1"), True),
+    **dict.fromkeys(("n", "no", "f", "false", "off", "0"), False),
+}
+
+
+def _str_to_bool(value: str) -> bool:
+    """
+    Converts a truth value string to a bool, raising ValueError for any other string.
+    """
+    try:
+        return _TRUTH_VALUES[value.lower()]
+    except KeyError:
+        raise ValueError(f"invalid truth value {value!r}") from None
+
+
 @dataclass
 class FileRef:
     """
@@ -61,24 +78,23 @@ class FilePathEditor:
             filename: str
             attr: str
             exists: str
-            for filename, attr, exists in zip(
-                cmd_results[0::3], cmd_results[1::3], cmd_results[2::3]
-            ):
+            # Step through the blocks by zipping one iterator with itself, without slicing copies
+            blocks = iter(cmd_results)
+            for filename, attr, exists in zip(blocks, blocks, blocks):
                 pattern_attr = attr.replace("fileTextureName", "computedFileTextureNamePattern")
-                if attr != pattern_attr and maya.cmds.getAttr(attr) != maya.cmds.getAttr(
-                    pattern_attr
-                ):
-                    # If the value for the computedFileTextureNamePattern attr is not equal to the
-                    # fileTextureName attr, then this was only the first file of a multi-tiled UV
-                    # texture or animated texture. We will append the path with the pattern instead
-                    # so that all texture files can be resolved later.
-                    attr = pattern_attr
-                    filename = maya.cmds.getAttr(pattern_attr)  # This is a full path
+                if attr != pattern_attr:
+                    pattern = maya.cmds.getAttr(pattern_attr)
+                    if maya.cmds.getAttr(attr) != pattern:
+                        # If the value for the computedFileTextureNamePattern attr is not equal to
+                        # the fileTextureName attr, then this was only the first file of a
+                        # multi-tiled UV texture or animated texture. We will append the path with
+                        # the pattern instead so that all texture files can be resolved later.
+                        filename = pattern  # This is a full path
 
                 refs.append(
                     FileRef(
                         os.path.join(directory, filename),
-                        bool(strtobool(exists)),
+                        _str_to_bool(exists),
                     )
                 )
         return refs
@@ -9,6 +9,7 @@ import logging
 import logging.handlers
 import os
 import tempfile
+from functools import lru_cache
 from typing import Any
 
 import maya.OpenMaya as om  # type: ignore # pylint: disable=import-error
@@ -38,43 +39,54 @@ class MayaConsoleHandler(logging.Handler):
             om.MGlobal.displayInfo(msg)
 
 
-class MayaLogger(logging.Logger):
-    def __init__(self, name):
-        super().__init__(name)
+@lru_cache(maxsize=1)
+def _get_console_handler() -> logging.Handler:
+    """
+    Returns the handler writing to the script editor, shared by every MayaLogger.
+    """
+    console_handler = MayaConsoleHandler()
+    fmt = logging.Formatter(
+        "[%(name)s] %(levelname)8s:  (%(threadName)-10s)  %(module)s %(funcName)s: %(message)s"
+    )
+    console_handler.setFormatter(fmt)
+    return console_handler
 
-        console_handler = MayaConsoleHandler()
-        fmt = logging.Formatter(
-            "[%(name)s] %(levelname)8s:  (%(threadName)-10s)"
-            "  %(module)s %(funcName)s: %(message)s"
-        )
-        console_handler.setFormatter(fmt)
 
-        self.addHandler(console_handler)
+@lru_cache(maxsize=1)
+def _get_disk_handler() -> logging.Handler:
+    """
+    Returns the handler writing to the log file, shared by every MayaLogger so that the log
+    directory is only checked once and a single handler rotates the file.
+    """
+    log_file = os.path.expanduser("~/.deadline/logs/submitters/maya.log")
 
-        log_file = os.path.expanduser("~/.deadline/logs/submitters/maya.log")
+    if not os.path.exists(os.path.dirname(log_file)):
+        # make sure the directories exist.
+        try:
+            os.makedirs(os.path.dirname(log_file))
+        except (IOError, OSError):
+            log_file = os.path.join(tempfile.gettempdir(), f"rfm.{os.getpid()}.log")
 
-        if not os.path.exists(os.path.dirname(log_file)):
-            # make sure the directories exist.
-            try:
-                os.makedirs(os.path.dirname(log_file))
-            except (IOError, OSError):
-                log_file = os.path.join(tempfile.gettempdir(), f"rfm.{os.getpid()}.log")
+    if not os.access(os.path.dirname(log_file), os.W_OK | os.R_OK):
+        # if we can't access the log file use a temp file.
+        log_file = os.path.join(tempfile.gettempdir(), f"rfm.{os.getpid()}.log")
 
-        if not os.access(os.path.dirname(log_file), os.W_OK | os.R_OK):
-            # if we can't access the log file use a temp file.
-            log_file = os.path.join(tempfile.gettempdir(), f"rfm.{os.getpid()}.log")
+    disk_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=10485760, backupCount=5)
+
+    # we use a different format for the disk log, to get a time stamp.
+    fmtf = logging.Formatter(
+        "%(asctime)s %(levelname)8s {%(threadName)-10s}:  %(module)s %(funcName)s: %(message)s"
+    )
+    disk_handler.setFormatter(fmtf)
+    return disk_handler
+
+
+class MayaLogger(logging.Logger):
+    def __init__(self, name):
+        super().__init__(name)
 
-        disk_handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=10485760, backupCount=5
-        )
-
-        # we use a different format for the disk log, to get a time stamp.
-        fmtf = logging.Formatter(
-            "%(asctime)s %(levelname)8s {%(threadName)-10s}"
-            ":  %(module)s %(funcName)s: %(message)s"
-        )
-        disk_handler.setFormatter(fmtf)
-        self.addHandler(disk_handler)
+        self.addHandler(_get_console_handler())
+        self.addHandler(_get_disk_handler())
 
         self.propagate = False
 
@@ -12,7 +12,6 @@ from dataclasses import dataclass
 import maya.cmds  # pylint: disable=import-error
 
 from deadline.client.api import get_deadline_cloud_library_telemetry_client
-from deadline.client.job_bundle._yaml import deadline_yaml_dump
 from deadline.client.ui.dialogs.submit_job_to_deadline_dialog import (  # pylint: disable=import-error
     SubmitJobToDeadlineDialog,
     JobBundlePurpose,
@@ -36,6 +35,7 @@ from .render_layers import (
     LayerSelection,
 )
 from .cameras import get_renderable_camera_names, ALL_CAMERAS
+from .utils import yaml_dump
 from ._version import version, version_tuple as adaptor_version_tuple
 from .ui.components.scene_settings_tab import SceneSettingsWidget
 from deadline.client.job_bundle.submission import AssetReferences
@@ -199,6 +199,13 @@ def _get_job_template(
     # Replicate the default step, once per render layer, and adjust its settings
     default_step = job_template["steps"][0]
     job_template["steps"] = []
+    # The init data shared by every step is in the default step's template. Only the lines that
+    # depend on the layer are built per step.
+    if settings.camera_selection == ALL_CAMERAS:
+        camera_init_data = ""
+    else:
+        # Link to the Camera parameter
+        camera_init_data = "camera: '{{Param.Camera}}'\n"
     for layer_data in render_layers:
         step = deepcopy(default_step)
         job_template["steps"].append(step)
@@ -237,10 +244,8 @@ def _get_job_template(
             + "image_height: {{Param."
             + (layer_data.image_height_parameter_name or "ImageHeight")
             + "}}\n"
+            + camera_init_data
         )
-        # If a specific camera is selected, link to the Camera parameter
-        if settings.camera_selection != ALL_CAMERAS:
-            init_data["data"] += "camera: '{{Param.Camera}}'\n"
 
         # If the renderer is Arnold, add specific parameters for it
         if layer_data.renderer_name == "arnold":
@@ -449,13 +454,14 @@ def show_maya_render_submitter(parent, f=Qt.WindowFlags()) -> "Optional[SubmitJo
     render_settings = RenderSubmitterUISettings()
 
     # Set the setting defaults that come from the scene
-    render_settings.name = Path(Scene.name()).name
+    scene_name = Scene.name()
+    render_settings.name = Path(scene_name).name
     render_settings.frame_list = str(Animation.frame_list())
     render_settings.project_path = Scene.project_path()
     render_settings.output_path = Scene.output_path()
 
     # Load the sticky settings
-    render_settings.load_sticky_settings(Scene.name())
+    render_settings.load_sticky_settings(scene_name)
 
     # Create a dictionary for the layers, and accumulate data about each layer
     render_layer_names = get_all_renderable_render_layer_names()
@@ -465,9 +471,13 @@ def show_maya_render_submitter(parent, f=Qt.WindowFlags()) -> "Optional[SubmitJo
         )
 
     render_layers: list[RenderLayerData] = []
-    with saved_current_render_layer():
+    with saved_current_render_layer() as current_layer_name:
+        # Switching render layers is expensive, so start with the current layer, which is
+        # already set. The layers are sorted by name afterwards.
+        render_layer_names.sort(key=lambda name: name != current_layer_name)
         for render_layer_name in render_layer_names:
-            set_current_render_layer(render_layer_name)
+            if render_layer_name != current_layer_name:
+                set_current_render_layer(render_layer_name)
 
             display_name = get_render_layer_display_name(render_layer_name)
             renderer_name = Scene.renderer()
@@ -477,7 +487,9 @@ def show_maya_render_submitter(parent, f=Qt.WindowFlags()) -> "Optional[SubmitJo
                 output_directories.update(
                     Scene.get_output_directories(render_layer_name, camera_name)
                 )
-            output_file_prefix = get_output_prefix_with_tokens()
+            output_file_prefix = get_output_prefix_with_tokens(
+                multiple_render_layers=len(render_layer_names) > 1
+            )
             image_resolution = (get_width(), get_height())
 
             render_layers.append(
@@ -501,8 +513,15 @@ def show_maya_render_submitter(parent, f=Qt.WindowFlags()) -> "Optional[SubmitJo
     # Sort the layers by name
     render_layers.sort(key=lambda layer: layer.display_name)
 
-    # Tell the settings tab the selectable cameras when only the current layer is in the job
-    current_layer_selectable_cameras: list[str] = get_renderable_camera_names()
+    # Tell the settings tab the selectable cameras when only the current layer is in the job.
+    # The current layer's cameras were already found above if it is renderable.
+    current_layer_selectable_cameras: list[str]
+    for layer in render_layers:
+        if layer.name == current_layer_name:
+            current_layer_selectable_cameras = layer.renderable_camera_names
+            break
+    else:
+        current_layer_selectable_cameras = get_renderable_camera_names()
     render_settings.current_layer_selectable_cameras = [ALL_CAMERAS] + sorted(
         current_layer_selectable_cameras
     )
@@ -611,19 +630,18 @@ def show_maya_render_submitter(parent, f=Qt.WindowFlags()) -> "Optional[SubmitJo
                 step["hostRequirements"] = host_requirements
 
         with open(job_bundle_path / "template.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump(job_template, f, indent=1)
+            yaml_dump(job_template, f, indent=1)
 
         with open(job_bundle_path / "parameter_values.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump({"parameterValues": parameter_values}, f, indent=1)
+            yaml_dump({"parameterValues": parameter_values}, f, indent=1)
 
         with open(job_bundle_path / "asset_references.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump(asset_references.to_dict(), f, indent=1)
+            yaml_dump(asset_references.to_dict(), f, indent=1)
 
         # Save Sticky Settings
         attachments: AssetReferences = widget.job_attachments.attachments
         settings.input_filenames = sorted(attachments.input_filenames)
         settings.input_directories = sorted(attachments.input_directories)
-        settings.input_filenames = sorted(attachments.input_filenames)
 
         settings.save_sticky_settings(Scene.name())
 
@@ -12,8 +12,9 @@ from PySide2.QtWidgets import (  # pylint: disable=import-error; type: ignore
 
 from deadline.client.ui import gui_error_handler
 from . import logger as deadline_logger  # type: ignore
-from .maya_render_submitter import show_maya_render_submitter
-from .job_bundle_output_test_runner import run_maya_render_submitter_job_bundle_output_test
+
+# The submitter modules, and the deadline.client dialogs they import, are only imported when a
+# command runs, so that loading the plugin stays fast for users who never open the submitter.
 
 
 class DeadlineCloudSubmitterCmd(om.MPxCommand):
@@ -63,6 +64,8 @@ class DeadlineCloudSubmitterCmd(om.MPxCommand):
                 if DeadlineCloudSubmitterCmd.dialog:
                     DeadlineCloudSubmitterCmd.dialog.show()
                 else:
+                    from .maya_render_submitter import show_maya_render_submitter
+
                     DeadlineCloudSubmitterCmd.dialog = show_maya_render_submitter(
                         parent=mainwin, f=Qt.Tool
                     )
@@ -79,4 +82,8 @@ class DeadlineCloudJobBundleOutputTestsCmd(om.MPxCommand):
         """
         Runs a set of job bundle output tests from a directory.
         """
+        from .job_bundle_output_test_runner import (
+            run_maya_render_submitter_job_bundle_output_test,
+        )
+
         run_maya_render_submitter_job_bundle_output_test()
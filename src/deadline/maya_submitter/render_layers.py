@@ -5,7 +5,7 @@ Functionality for interacting with Maya's Render Layers
 """
 from contextlib import contextmanager
 from enum import IntEnum
-from typing import List
+from typing import Iterator, List
 
 import maya.cmds
 import maya.mel
@@ -22,17 +22,14 @@ class LayerSelection(IntEnum):
 
 
 def get_all_renderable_render_layer_names() -> List[str]:
-    render_layer_names = maya.cmds.ls(type="renderLayer")
-    # Filter out any render layers that are referenced in other files,
-    # because they cannot be set as the current render layer.
-    render_layer_names = [
+    # Filter out any render layers that are referenced in other files, because they cannot be
+    # set as the current render layer, and any non-renderable layers, in a single pass.
+    return [
         name
-        for name in render_layer_names
+        for name in maya.cmds.ls(type="renderLayer")
         if not maya.cmds.referenceQuery(name, isNodeReferenced=True)
+        and is_render_layer_renderable(name)
     ]
-    # Filter out any non-renderable layers
-    render_layer_names = [name for name in render_layer_names if is_render_layer_renderable(name)]
-    return render_layer_names
 
 
 def get_current_render_layer_name() -> str:
@@ -64,10 +61,12 @@ def render_setup_include_all_lights() -> bool:
 
 
 @contextmanager
-def saved_current_render_layer():
+def saved_current_render_layer() -> Iterator[str]:
     """
-    Saves and restores the current render layer.
+    Saves and restores the current render layer. The saved render layer's name is yielded, and
+    the layer is only switched back to if the block left a different one current.
     """
     saved_render_layer_name = get_current_render_layer_name()
-    yield
-    set_current_render_layer(saved_render_layer_name)
+    yield saved_render_layer_name
+    if get_current_render_layer_name() != saved_render_layer_name:
+        set_current_render_layer(saved_render_layer_name)
@@ -1,11 +1,12 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 from __future__ import annotations
 
-from collections import deque
+import re
+from typing import Optional
 
 import maya.cmds
 
-from .cameras import get_renderable_camera_names
+from .cameras import has_multiple_renderable_cameras
 from .render_layers import get_all_renderable_render_layer_names
 
 
@@ -25,6 +26,8 @@ def get_height() -> int:
 
 _LAYER_TOKENS = ("<Layer>", "<RenderLayer>", "%l")
 _CAMERA_TOKENS = ("<Camera>", "%c")
+_LAYER_TOKENS_RE = re.compile("|".join(map(re.escape, _LAYER_TOKENS)))
+_CAMERA_TOKENS_RE = re.compile("|".join(map(re.escape, _CAMERA_TOKENS)))
 
 
 def _get_base_output_prefix():
@@ -37,21 +40,26 @@ def _get_base_output_prefix():
     return "<Scene>"
 
 
-def get_output_prefix_with_tokens():
+def get_output_prefix_with_tokens(multiple_render_layers: Optional[bool] = None) -> str:
     """
     Retrieves the Output Prefix adding in all missing tokens
+
+    Args:
+        multiple_render_layers (Optional[bool]): Whether more than one render layer is
+            renderable. Callers that already know can pass it to avoid querying every render
+            layer in the scene again.
     """
     prefix = _get_base_output_prefix()
 
-    sections = deque(prefix.split("/"))
+    sections = prefix.split("/")
 
-    if len(get_renderable_camera_names()) > 1 and not any(
-        token in prefix for token in _CAMERA_TOKENS
-    ):
-        sections.appendleft("<Camera>")
-    if len(get_all_renderable_render_layer_names()) > 1 and not any(
-        token in prefix for token in _LAYER_TOKENS
-    ):
-        sections.appendleft("<Layer>")
+    # Check the prefix for the tokens first, so the scene is only queried when a token is missing
+    if not _CAMERA_TOKENS_RE.search(prefix) and has_multiple_renderable_cameras():
+        sections.insert(0, "<Camera>")
+    if not _LAYER_TOKENS_RE.search(prefix):
+        if multiple_render_layers is None:
+            multiple_render_layers = len(get_all_renderable_render_layer_names()) > 1
+        if multiple_render_layers:
+            sections.insert(0, "<Layer>")
 
     return "/".join(sections)
@@ -83,9 +83,7 @@ class Scene:
 
     @staticmethod
     def ensure_arnold_options_loaded() -> None:
-        try:
-            maya.cmds.listAttr("defaultArnoldRenderOptions")
-        except ValueError:
+        if not maya.cmds.objExists("defaultArnoldRenderOptions"):
             try:
                 from mtoa.core import createOptions
 
@@ -208,8 +206,20 @@ class FrameRange:
 
         return f"{self.start}-{self.stop}:{self.step}"
 
-    def __iter__(self) -> Iterator[int]:
+    def _range(self) -> range:
+        """
+        Returns the frames as a range. It is not cached, since the fields may be reassigned.
+        """
         stop: int = self.stop if self.stop is not None else self.start
         step: int = self.step if self.step is not None else 1
 
-        return iter(range(self.start, stop + step, step))
+        return range(self.start, stop + step, step)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._range())
+
+    def __len__(self) -> int:
+        return len(self._range())
+
+    def __contains__(self, frame: object) -> bool:
+        return frame in self._range()
@@ -1,7 +1,9 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 import os
+from contextlib import contextmanager
 
 from PySide2.QtCore import QSize, Qt  # type: ignore
+from PySide2.QtGui import QStandardItem, QStandardItemModel  # type: ignore
 from PySide2.QtWidgets import (  # type: ignore
     QCheckBox,
     QComboBox,
@@ -23,6 +25,58 @@ from ...render_layers import LayerSelection
 UI widgets for the Scene Settings tab.
 """
 
+_DEVELOPER_OPTIONS = os.environ.get("DEADLINE_ENABLE_DEVELOPER_OPTIONS", "").upper() == "TRUE"
+
+_LAYER_ITEMS = (
+    (LayerSelection.ALL, "All Renderable Layers"),
+    (LayerSelection.CURRENT, "Current Layer"),
+)
+_LAYER_MODEL = None
+# Width, in characters, the cameras box is sized to instead of measuring every camera name
+_CAMERA_NAME_MIN_LENGTH = 24
+
+
+@contextmanager
+def _updates_disabled(*widgets):
+    """
+    Disables painting of the given widgets for the duration of the block, so
+    that a bulk rebuild results in a single repaint.
+    """
+    for widget in widgets:
+        widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        for widget in widgets:
+            widget.setUpdatesEnabled(True)
+
+
+def _build_item_model(items, parent=None) -> QStandardItemModel:
+    """
+    Builds a single column item model from (data, text) pairs, inserting all
+    of the rows at once.
+    """
+    column = []
+    for data, text in items:
+        item = QStandardItem(text)
+        item.setData(data, Qt.UserRole)
+        column.append(item)
+
+    model = QStandardItemModel(parent)
+    model.appendColumn(column)
+    return model
+
+
+def _get_layer_model() -> QStandardItemModel:
+    """
+    Returns the item model for the render layer selection box. The entries never
+    change, so a single unparented model is shared by every widget instance.
+    """
+    global _LAYER_MODEL
+    if _LAYER_MODEL is None:
+        _LAYER_MODEL = _build_item_model(_LAYER_ITEMS)
+    return _LAYER_MODEL
+
 
 class FileSearchLineEdit(QWidget):
     """
@@ -33,14 +87,15 @@ class FileSearchLineEdit(QWidget):
         super().__init__(parent=parent)
 
         if directory_only and file_format is not None:
-            raise ValueError("")
+            raise ValueError(
+                "FileSearchLineEdit does not support a file_format when directory_only is True"
+            )
 
         self.file_format = file_format
         self.directory_only = directory_only
 
         lyt = QHBoxLayout(self)
         lyt.setContentsMargins(0, 0, 0, 0)
-        lyt.setMargin(0)
 
         self.edit = QLineEdit(self)
         self.btn = QPushButton("...", parent=self)
@@ -59,7 +114,9 @@ class FileSearchLineEdit(QWidget):
                 self,
                 "Open Directory",
                 self.edit.text(),
-                QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks,
+                QFileDialog.ShowDirsOnly
+                | QFileDialog.DontResolveSymlinks
+                | QFileDialog.DontUseCustomDirectoryIcons,
             )
         else:
             new_txt = QFileDialog.getOpenFileName(self, "Select File", self.edit.text())
@@ -85,74 +142,92 @@ class SceneSettingsWidget(QWidget):
     Widget containing all top level scene settings.
     """
 
+    # Enum values compared in signal handlers
+    _QT_CHECKED = Qt.Checked
+    _LAYER_ALL = LayerSelection.ALL
+
     def __init__(self, initial_settings, parent=None):
         super().__init__(parent=parent)
 
-        self.developer_options = (
-            os.environ.get("DEADLINE_ENABLE_DEVELOPER_OPTIONS", "").upper() == "TRUE"
-        )
+        self.developer_options = _DEVELOPER_OPTIONS
 
         # Save the two lists of selectable cameras
         self.all_layer_selectable_cameras = initial_settings.all_layer_selectable_cameras
         self.current_layer_selectable_cameras = initial_settings.current_layer_selectable_cameras
+        # The camera list currently shown in the cameras box
+        self._displayed_cameras = None
 
         self._build_ui(initial_settings)
         self._configure_settings(initial_settings)
 
     def _build_ui(self, settings):
-        lyt = QGridLayout(self)
-        self.proj_path_txt = FileSearchLineEdit(directory_only=True, parent=self)
-        lyt.addWidget(QLabel("Project Path"), 0, 0)
-        lyt.addWidget(self.proj_path_txt, 0, 1)
-
-        self.op_path_txt = FileSearchLineEdit(directory_only=True)
-        lyt.addWidget(QLabel("Output Path"), 1, 0)
-        lyt.addWidget(self.op_path_txt, 1, 1)
-
-        self.layers_box = QComboBox(self)
-        layer_items = [
-            (LayerSelection.ALL, "All Renderable Layers"),
-            (LayerSelection.CURRENT, "Current Layer"),
-        ]
-        for layer_value, text in layer_items:
-            self.layers_box.addItem(text, layer_value)
-        lyt.addWidget(QLabel("Render Layers"), 2, 0)
-        lyt.addWidget(self.layers_box, 2, 1)
-        self.layers_box.currentIndexChanged.connect(self._fill_cameras_box)
-
-        self.cameras_box = QComboBox(self)
-        lyt.addWidget(QLabel("Cameras"), 3, 0)
-        lyt.addWidget(self.cameras_box, 3, 1)
-
-        self.frame_override_chck = QCheckBox("Override Frame Range", self)
-        self.frame_override_txt = QLineEdit(self)
-        lyt.addWidget(self.frame_override_chck, 4, 0)
-        lyt.addWidget(self.frame_override_txt, 4, 1)
-        self.frame_override_chck.stateChanged.connect(self.activate_frame_override_changed)
-
-        if self.developer_options:
-            self.include_adaptor_wheels = QCheckBox(
-                "Developer Option: Include Adaptor Wheels", self
-            )
-            lyt.addWidget(self.include_adaptor_wheels, 5, 0)
-
-        lyt.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding), 10, 0)
+        with _updates_disabled(self):
+            lyt = QGridLayout(self)
+            self.proj_path_txt = FileSearchLineEdit(directory_only=True, parent=self)
+            lyt.addWidget(self._label("Project Path"), 0, 0)
+            lyt.addWidget(self.proj_path_txt, 0, 1)
+
+            self.op_path_txt = FileSearchLineEdit(directory_only=True)
+            lyt.addWidget(self._label("Output Path"), 1, 0)
+            lyt.addWidget(self.op_path_txt, 1, 1)
+
+            self.layers_box = QComboBox(self)
+            self.layers_box.setModel(_get_layer_model())
+            lyt.addWidget(self._label("Render Layers"), 2, 0)
+            lyt.addWidget(self.layers_box, 2, 1)
+            self.layers_box.currentIndexChanged.connect(self._fill_cameras_box)
+
+            self.cameras_box = QComboBox(self)
+            self.cameras_box.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+            self.cameras_box.setMinimumContentsLength(_CAMERA_NAME_MIN_LENGTH)
+            lyt.addWidget(self._label("Cameras"), 3, 0)
+            lyt.addWidget(self.cameras_box, 3, 1)
+
+            self.frame_override_chck = QCheckBox("Override Frame Range", self)
+            self.frame_override_txt = QLineEdit(self)
+            lyt.addWidget(self.frame_override_chck, 4, 0)
+            lyt.addWidget(self.frame_override_txt, 4, 1)
+            self.frame_override_chck.stateChanged.connect(self.activate_frame_override_changed)
+
+            if self.developer_options:
+                self.include_adaptor_wheels = QCheckBox(
+                    "Developer Option: Include Adaptor Wheels", self
+                )
+                lyt.addWidget(self.include_adaptor_wheels, 5, 0)
+
+            lyt.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding), 10, 0)
 
         self._fill_cameras_box(0)
 
+    def _label(self, text: str) -> QLabel:
+        """
+        Creates a label parented to this widget.
+        """
+        return QLabel(text, self)
+
     def _fill_cameras_box(self, _):
         with block_signals(self.cameras_box):
             # Determine the list of selectable cameras
-            if self.layers_box.currentData() == LayerSelection.ALL:
+            if self.layers_box.currentData() == self._LAYER_ALL:
                 selectable_cameras = self.all_layer_selectable_cameras
             else:
                 selectable_cameras = self.current_layer_selectable_cameras
 
+            # Nothing to do if the cameras box already shows this list
+            if selectable_cameras == self._displayed_cameras:
+                return
+
             # Save the current camera and reset the camera box list
             saved_camera_name = self.cameras_box.currentData()
-            self.cameras_box.clear()
-            for camera_name in selectable_cameras:
-                self.cameras_box.addItem(camera_name, camera_name)
+            with _updates_disabled(self.cameras_box, self.cameras_box.view()):
+                # Replacing the model deletes the previous one, since it is parented to the box
+                self.cameras_box.setModel(
+                    _build_item_model(
+                        ((camera_name, camera_name) for camera_name in selectable_cameras),
+                        self.cameras_box,
+                    )
+                )
+            self._displayed_cameras = selectable_cameras
 
             # Re-select the camera if possible
             index = self.cameras_box.findData(saved_camera_name)
@@ -200,4 +275,4 @@ class SceneSettingsWidget(QWidget):
         """
         Set the activated/deactivated status of the Frame override text box
         """
-        self.frame_override_txt.setEnabled(state == Qt.Checked)
+        self.frame_override_txt.setEnabled(state == self._QT_CHECKED)
@@ -9,8 +9,11 @@ import os
 import re
 import time
 from functools import wraps
-from typing import Callable
+from typing import IO, Any, Callable, Optional
 
+import yaml  # type: ignore[import]
+from deadline.client.job_bundle._yaml import DeadlineDumper, DeadlineRepresenter
+from yaml.resolver import Resolver  # type: ignore[import]
 from maya.app.general.fileTexturePathResolver import _patternToRegex
 
 
@@ -21,6 +24,66 @@ def join_paths(first: str, *remainder: str) -> str:
     return os.path.join(first, *remainder).replace("\\", "/")
 
 
+if yaml.__with_libyaml__:
+    from yaml.cyaml import CEmitter  # type: ignore[import]
+
+    class _CDeadlineDumper(CEmitter, DeadlineRepresenter, Resolver):
+        """
+        deadline-cloud's DeadlineDumper, with libyaml's C emitter in place of the pure Python one.
+        """
+
+        def __init__(
+            self,
+            stream,
+            default_style=None,
+            default_flow_style=False,
+            canonical=None,
+            indent=None,
+            width=None,
+            allow_unicode=None,
+            line_break=None,
+            encoding=None,
+            explicit_start=None,
+            explicit_end=None,
+            version=None,
+            tags=None,
+            sort_keys=True,
+        ):
+            CEmitter.__init__(
+                self,
+                stream,
+                canonical=canonical,
+                indent=indent,
+                width=width,
+                encoding=encoding,
+                allow_unicode=allow_unicode,
+                line_break=line_break,
+                explicit_start=explicit_start,
+                explicit_end=explicit_end,
+                version=version,
+                tags=tags,
+            )
+            DeadlineRepresenter.__init__(  # type: ignore[call-arg]
+                self,
+                default_style=default_style,
+                default_flow_style=default_flow_style,
+                sort_keys=sort_keys,
+            )
+            Resolver.__init__(self)
+
+    _YAML_DUMPER: type = _CDeadlineDumper
+else:
+    _YAML_DUMPER = DeadlineDumper
+
+
+def yaml_dump(data: Any, stream: Optional[IO[str]] = None, **kwargs) -> Optional[str]:
+    """
+    Works like deadline-cloud's deadline_yaml_dump, saving multi-line strings with the "|" style
+    and defaulting to sort_keys=False, but emits with libyaml when PyYAML was built with it.
+    """
+    return yaml.dump_all([data], stream, Dumper=_YAML_DUMPER, sort_keys=False, **kwargs)
+
+
 def timed_func(func: Callable):
     """Decorator that wraps a function gives performance timing"""
 
@@ -58,16 +121,17 @@ def findAllFilesForPattern(pattern: str, frameNumber: int) -> list[str]:
     """
     dirname, basename = os.path.split(pattern)
     result: list[str] = []
-    # Have to keep this existence check since listdir will error out if the dir doesn't exist
-    if dirname and basename and os.path.isdir(dirname):
+    if dirname and basename:
         if frameNumber is not None:
             # _patternToRegex handles frame tokens, but this is for only finding files for a specific frame
             basename = basename.replace("<f>", "0*" + str(frameNumber))
-        regex = _patternToRegex(basename)
-        result = [
-            os.path.join(dirname, f)
-            for f in os.listdir(dirname)
-            if re.match(regex, f, flags=re.IGNORECASE) and os.path.isfile(os.path.join(dirname, f))
-        ]
+        match = re.compile(_patternToRegex(basename), flags=re.IGNORECASE).match
+        try:
+            # scandir's entries know whether they are files without another stat call on most
+            # platforms, and a missing directory is reported without a separate existence check
+            with os.scandir(dirname) as entries:
+                result = [entry.path for entry in entries if match(entry.name) and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            pass
 
     return result
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import logging
 import os
 import re
+import threading
 from collections import namedtuple
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -12,7 +14,8 @@ from unittest.mock import ANY, Mock, PropertyMock, patch
 import pytest
 import jsonschema  # type: ignore
 from openjd.adaptor_runtime.adaptors import SemanticVersion
-from openjd.adaptor_runtime_client import PathMappingRule
+from openjd.adaptor_runtime.app_handlers import RegexCallback
+from openjd.adaptor_runtime_client import Action, PathMappingRule
 
 import deadline.maya_adaptor.MayaAdaptor.adaptor as adaptor_module
 from deadline.maya_adaptor.MayaAdaptor import MayaAdaptor
@@ -57,6 +60,76 @@ def run_data() -> dict:
     return {"frame": 42}
 
 
+class TestMayaActionsQueue:
+    def test_enqueue_actions_preserves_order(self) -> None:
+        """Tests that a batch of actions is dequeued in the order it was enqueued"""
+        # GIVEN
+        queue = adaptor_module._MayaActionsQueue(threading.Event())
+        queue.enqueue_action(Action("first"))
+
+        # WHEN
+        queue.enqueue_actions([Action("second"), Action("third")])
+
+        # THEN
+        assert len(queue) == 3
+        actions = [queue.dequeue_action() for _ in range(3)]
+        assert all(action is not None for action in actions)
+        assert [action.name for action in actions if action is not None] == [
+            "first",
+            "second",
+            "third",
+        ]
+
+    def test_dequeue_action_sets_event(self) -> None:
+        """Tests that the event is only set when an action is actually dequeued"""
+        # GIVEN
+        event = threading.Event()
+        queue = adaptor_module._MayaActionsQueue(event)
+
+        # WHEN
+        queue.dequeue_action()
+
+        # THEN
+        assert not event.is_set()
+
+        # WHEN
+        queue.enqueue_actions([Action("renderer")])
+        queue.dequeue_action()
+
+        # THEN
+        assert event.is_set()
+
+
+class TestMayaRegexHandler:
+    @pytest.mark.parametrize(
+        "msg, progress_called, error_called",
+        [
+            ("Loading plugin mtoa", False, False),
+            ("[PROGRESS] 50 percent", True, False),
+            ("Error: [PROGRESS] 50 percent", True, True),
+        ],
+    )
+    def test_emit(self, msg: str, progress_called: bool, error_called: bool) -> None:
+        """Tests that every matching callback is called, and only those"""
+        # GIVEN
+        progress_callback = Mock()
+        error_callback = Mock()
+        handler = adaptor_module._MayaRegexHandler(
+            [
+                RegexCallback([re.compile("\\[PROGRESS\\] ([0-9]+) percent")], progress_callback),
+                RegexCallback([re.compile(".*Error:.*")], error_callback),
+            ]
+        )
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, msg, None, None)
+
+        # WHEN
+        handler.emit(record)
+
+        # THEN
+        assert progress_callback.called == progress_called
+        assert error_callback.called == error_called
+
+
 class TestMayaAdaptor_on_start:
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.MayaAdaptor._get_deadline_telemetry_client")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
@@ -75,33 +148,24 @@ class TestMayaAdaptor_on_start:
         mock_server.return_value.server_path = "/tmp/9999"
         adaptor.on_start()
 
-    @patch("time.sleep")
-    @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.MayaAdaptor._get_deadline_telemetry_client")
-    @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
-    @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.AdaptorServer")
-    def test__wait_for_socket(
-        self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-        mock_telemetry_client: Mock,
-        mock_sleep: Mock,
-        init_data: dict,
-    ) -> None:
-        """Tests that the _wait_for_socket method sleeps until a socket is available"""
+    def test__wait_for_socket(self, init_data: dict) -> None:
+        """Tests that the _wait_for_socket method waits until the server signals it is ready"""
         # GIVEN
         adaptor = MayaAdaptor(init_data)
-        socket_mock = PropertyMock(
-            side_effect=[None, None, None, "/tmp/9999", "/tmp/9999", "/tmp/9999"]
-        )
-        type(mock_server.return_value).server_path = socket_mock
+
+        def start_server():
+            adaptor._server = Mock(server_path="/tmp/9999")
+            adaptor._socket_ready.set()
+
+        timer = threading.Timer(0.05, start_server)
+        timer.start()
 
         # WHEN
-        adaptor.on_start()
+        server_path = adaptor._wait_for_socket()
 
         # THEN
-        assert mock_sleep.call_count == 3
+        timer.join()
+        assert server_path == "/tmp/9999"
 
     @patch("threading.Thread")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.AdaptorServer")
@@ -186,7 +250,7 @@ class TestMayaAdaptor_on_start:
         error_msg = "Maya encountered an error and was not able to complete initialization actions."
         assert str(exc_info.value) == error_msg
 
-    @patch.object(MayaAdaptor, "_action_queue")
+    @patch.object(adaptor_module, "_MayaActionsQueue")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.MayaAdaptor._get_deadline_telemetry_client")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.AdaptorServer")
@@ -195,9 +259,10 @@ class TestMayaAdaptor_on_start:
         mock_server: Mock,
         mock_logging_subprocess: Mock,
         mock_telemetry_client: Mock,
-        mock_actions_queue: Mock,
+        mock_actions_queue_cls: Mock,
     ) -> None:
         """Tests that on_start completes without error"""
+        mock_actions_queue = mock_actions_queue_cls.return_value
         mock_actions_queue.__len__.return_value = 0
 
         adaptor = MayaAdaptor(
@@ -215,15 +280,18 @@ class TestMayaAdaptor_on_start:
 
         adaptor.on_start()
 
-        calls = mock_actions_queue.enqueue_action.call_args_list
-        assert calls[0].args[0].name == "renderer"
-        assert calls[1].args[0].name == "path_mapping"
-        for call, action_name in zip(calls[2 : len(_FIRST_MAYA_ACTIONS) + 2], _FIRST_MAYA_ACTIONS):
-            assert call.args[0].name == action_name
+        mock_actions_queue.enqueue_actions.assert_called_once()
+        actions = mock_actions_queue.enqueue_actions.call_args.args[0]
+        assert actions[0].name == "renderer"
+        assert actions[1].name == "path_mapping"
+        for action, action_name in zip(
+            actions[2 : len(_FIRST_MAYA_ACTIONS) + 2], _FIRST_MAYA_ACTIONS
+        ):
+            assert action.name == action_name
 
     @patch.object(MayaAdaptor, "map_path")
     @patch.object(MayaAdaptor, "path_mapping_rules", new_callable=PropertyMock)
-    @patch.object(MayaAdaptor, "_action_queue")
+    @patch.object(adaptor_module, "_MayaActionsQueue")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.MayaAdaptor._get_deadline_telemetry_client")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.AdaptorServer")
@@ -232,11 +300,12 @@ class TestMayaAdaptor_on_start:
         mock_server: Mock,
         mock_logging_subprocess: Mock,
         mock_telemetry_client: Mock,
-        mock_actions_queue: Mock,
+        mock_actions_queue_cls: Mock,
         mock_rules: Mock,
         mock_map: Mock,
     ) -> None:
         """Tests that on_start completes without error"""
+        mock_actions_queue = mock_actions_queue_cls.return_value
         mock_actions_queue.__len__.return_value = 0
         mock_rules.return_value = [
             PathMappingRule(
@@ -262,12 +331,73 @@ class TestMayaAdaptor_on_start:
 
         adaptor.on_start()
 
-        calls = mock_actions_queue.enqueue_action.call_args_list
+        actions = mock_actions_queue.enqueue_actions.call_args.args[0]
 
-        mapping_call = calls[1].args[0]
+        mapping_call = actions[1]
 
         assert mapping_call.name == "path_mapping"
         assert mapping_call.args["path_mapping_rules"] == {"/source": "/destination"}
+        assert [action.name for action in actions[2 + len(_FIRST_MAYA_ACTIONS) :]] == [
+            "output_file_path",
+            "render_layer",
+        ]
+
+    @patch.object(adaptor_module, "_MayaActionsQueue")
+    @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.MayaAdaptor._get_deadline_telemetry_client")
+    @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.LoggingSubprocess")
+    @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.AdaptorServer")
+    def test_populate_action_queue_order(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_telemetry_client: Mock,
+        mock_actions_queue_cls: Mock,
+    ) -> None:
+        """
+        Tests that the scene settings are queued before the render layer, so that they apply to
+        it, and the camera after it
+        """
+        # GIVEN
+        mock_actions_queue = mock_actions_queue_cls.return_value
+        mock_actions_queue.__len__.return_value = 0
+        adaptor = MayaAdaptor(
+            {
+                "renderer": "arnold",
+                "scene_file": "/path/to/file",
+                "project_path": "/path/to/dir",
+                "animation": True,
+                "version": 2022,
+                "camera": "persp",
+                "render_layer": "layer",
+                "render_setup_include_lights": True,
+                "output_file_prefix": "<Scene>",
+                "output_file_path": "/output/path",
+                "image_width": 1920,
+                "image_height": 1080,
+                "error_on_arnold_license_fail": True,
+            }
+        )
+        mock_server.return_value.server_path = "/tmp/9999"
+
+        # WHEN
+        adaptor.on_start()
+
+        # THEN
+        actions = mock_actions_queue.enqueue_actions.call_args.args[0]
+        assert [action.name for action in actions] == [
+            "renderer",
+            "path_mapping",
+            "scene_file",
+            "project_path",
+            "error_on_arnold_license_fail",
+            "image_height",
+            "image_width",
+            "output_file_path",
+            "output_file_prefix",
+            "render_setup_include_lights",
+            "render_layer",
+            "camera",
+        ]
 
     @pytest.mark.parametrize(
         "renderer, expected",
@@ -276,7 +406,7 @@ class TestMayaAdaptor_on_start:
     @patch.object(MayaAdaptor, "_setup_arnold_pathmapping")
     @patch.object(MayaAdaptor, "map_path")
     @patch.object(MayaAdaptor, "path_mapping_rules", new_callable=PropertyMock)
-    @patch.object(MayaAdaptor, "_action_queue")
+    @patch.object(adaptor_module, "_MayaActionsQueue")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.MayaAdaptor._get_deadline_telemetry_client")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.AdaptorServer")
@@ -285,7 +415,7 @@ class TestMayaAdaptor_on_start:
         mock_server: Mock,
         mock_logging_subprocess: Mock,
         mock_telemetry_client: Mock,
-        mock_actions_queue: Mock,
+        mock_actions_queue_cls: Mock,
         mock_rules: Mock,
         mock_map: Mock,
         mock_setup_arnold_pathmapping: Mock,
@@ -294,6 +424,7 @@ class TestMayaAdaptor_on_start:
     ):
         """Tests that the _setup_arnold_pathmapping is called if the renderer is arnold"""
         # GIVEN
+        mock_actions_queue = mock_actions_queue_cls.return_value
         mock_actions_queue.__len__.return_value = 0
         mock_rules.return_value = [
             PathMappingRule(
@@ -392,8 +523,9 @@ class TestMayaAdaptor_on_start:
                 Path(adaptor._arnold_temp_dir.name) / "arnold_pathmapping.json"
             )
             mock_open.assert_called_with(Path(arnold_json_path), open_mode="w")
-            mock_json.dump.assert_called_once_with(
-                expected_json, mock_open.return_value.__enter__.return_value
+            mock_json.dumps.assert_called_once_with(expected_json, separators=(",", ":"))
+            mock_open.return_value.__enter__.return_value.write.assert_called_once_with(
+                mock_json.dumps.return_value
             )
 
     @patch.object(MayaAdaptor, "_maya_is_running", False)
@@ -421,7 +553,7 @@ class TestMayaAdaptor_on_start:
         error_msg = " is a required property"
         assert error_msg in exc_info.value.message
 
-    @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.get_deadline_cloud_library_telemetry_client")
+    @patch("deadline.client.api.get_deadline_cloud_library_telemetry_client")
     def test_get_deadline_telemetry_client(
         self,
         mock_deadline_telemetry_client: Mock,
@@ -452,20 +584,61 @@ class TestMayaAdaptor_on_start:
         )
         mock_deadline_telemetry_client.assert_called_once()
 
+    @patch.object(adaptor_module, "_MAYA_CLIENT_PATH", "/does/not/exist/maya_client.py")
     @patch("sys.path")
     def test_maya_client_path_file_not_found_error(
         self, syspath_mock: Mock, init_data: dict
     ) -> None:
         """Tests that a file not found error is raised if not maya path is found"""
-        with pytest.raises(FileNotFoundError) as exc_info:
-            adaptor = MayaAdaptor(init_data)
-            adaptor.maya_client_path
+        adaptor_module._get_maya_client_path.cache_clear()
+        try:
+            with pytest.raises(FileNotFoundError) as exc_info:
+                adaptor = MayaAdaptor(init_data)
+                adaptor.maya_client_path
+        finally:
+            adaptor_module._get_maya_client_path.cache_clear()
 
         assert (
             "Could not find maya_client.py. Check that the MayaClient package is in one of the following directories"
             in str(exc_info.value)
         )
 
+    @patch("sys.path", [])
+    def test_maya_client_path_installed_alongside_adaptor(self, init_data: dict) -> None:
+        """Tests that the maya_client.py installed next to the adaptor is found without sys.path"""
+        adaptor_module._get_maya_client_path.cache_clear()
+        try:
+            adaptor = MayaAdaptor(init_data)
+            maya_client_path = adaptor.maya_client_path
+        finally:
+            adaptor_module._get_maya_client_path.cache_clear()
+
+        assert os.path.isfile(maya_client_path)
+        assert Path(maya_client_path).parts[-3:] == ("maya_adaptor", "MayaClient", "maya_client.py")
+
+    @pytest.mark.parametrize("python_path", ["", "/existing/path"])
+    @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.LoggingSubprocess")
+    def test_start_maya_client_python_path(
+        self, mock_logging_subprocess: Mock, init_data: dict, python_path: str
+    ) -> None:
+        """Tests that PYTHONPATH gets the namespace dirs once, without empty entries"""
+        # GIVEN
+        adaptor = MayaAdaptor(init_data)
+
+        with patch.dict(os.environ, {"PYTHONPATH": python_path}):
+            # WHEN
+            adaptor._start_maya_client()
+            adaptor._start_maya_client()
+
+            # THEN
+            python_paths = os.environ["PYTHONPATH"].split(os.pathsep)
+        existing_paths = [python_path] if python_path else []
+        assert "" not in python_paths
+        assert python_paths[: len(existing_paths)] == existing_paths
+        # The openjd and deadline namespace dirs are each added once
+        assert len(python_paths) == len(existing_paths) + 2
+        assert len(set(python_paths)) == len(python_paths)
+
     def test_semantic_version(self, init_data: dict) -> None:
         """Tests that the adaptor semantic version is in the expected format"""
         adaptor = MayaAdaptor(init_data)
@@ -473,7 +646,7 @@ class TestMayaAdaptor_on_start:
 
 
 class TestMayaAdaptor_on_run:
-    @patch("time.sleep")
+    @patch.object(MayaAdaptor, "_wait_for_maya")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.MayaAdaptor._get_deadline_telemetry_client")
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.maya_adaptor.MayaAdaptor.adaptor.LoggingSubprocess")
@@ -484,7 +657,7 @@ class TestMayaAdaptor_on_run:
         mock_logging_subprocess: Mock,
         mock_actions_queue: Mock,
         mock_telemetry_client: Mock,
-        mock_sleep: Mock,
+        mock_wait_for_maya: Mock,
         init_data: dict,
         run_data: dict,
     ) -> None:
@@ -501,9 +674,9 @@ class TestMayaAdaptor_on_run:
         adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(0.1)
+        mock_wait_for_maya.assert_called_once_with()
 
-    @patch("time.sleep")
+    @patch.object(MayaAdaptor, "_wait_for_maya")
     @patch(
         "deadline.maya_adaptor.MayaAdaptor.adaptor.MayaAdaptor._is_rendering",
         new_callable=PropertyMock,
@@ -524,7 +697,7 @@ class TestMayaAdaptor_on_run:
         mock_telemetry_client: Mock,
         mock_maya_is_running: Mock,
         mock_is_rendering: Mock,
-        mock_sleep: Mock,
+        mock_wait_for_maya: Mock,
         init_data: dict,
         run_data: dict,
     ) -> None:
@@ -542,7 +715,7 @@ class TestMayaAdaptor_on_run:
             adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(0.1)
+        mock_wait_for_maya.assert_called_once_with()
         assert str(exc_info.value) == (
             "Maya exited early and did not render successfully, please check render logs. "
             "Exit code 1"
@@ -787,6 +960,28 @@ class TestMayaAdaptor_on_cleanup:
         assert match is not None
         assert str(adaptor._exc_info) == f"Maya Encountered an Error: {stdout}"
 
+    @pytest.mark.parametrize(
+        "stdout, matched",
+        [
+            ('Error: Cannot find procedure "foo".', True),
+            ("// Warning: file: somefile.mel line 1: Attribute is invalid.", True),
+            ("RuntimeError: Error encountered when initializing Maya", True),
+            ("G32001\t{SEVERE}  Out of memory allocating tessellation cache.", True),
+            ("00:00:12  1234MB         |    [gpu] rendering bucket 12 of 64", False),
+        ],
+    )
+    def test_error_regex_matches_whole_line(self, stdout: str, matched: bool) -> None:
+        """Tests that the anchored error pattern matches entire error lines, and nothing else"""
+        # WHEN
+        match = adaptor_module._ERROR_REGEXES[0].search(stdout)
+
+        # THEN
+        if matched:
+            assert match is not None
+            assert match.group(0) == stdout
+        else:
+            assert match is None
+
     def test_handle_version(self, init_data: dict):
         """Tests that the _handle_maya_version method returns the version correctly"""
         # GIVEN
@@ -834,6 +1029,61 @@ class TestMayaAdaptor_on_cleanup:
             f"ADSKFLEX_LICENSE_FILE: {license_file}"
         )
 
+    @patch.object(adaptor_module.shutil, "disk_usage")
+    def test_license_handle_error_only_once(self, mock_disk_usage: Mock, init_data: dict) -> None:
+        """Tests that repeated license errors keep the first error and only check the disk once"""
+        # GIVEN
+        adaptor = MayaAdaptor(init_data)
+        match = adaptor_module._MAYA_LICENSE_ERROR_REGEXES[0].search(
+            "RuntimeError: Error encountered when initializing Maya - "
+            "Please check for sufficient disk space "
+            "and necessary write permissions of MAYA_APP_DIR."
+        )
+        assert match is not None
+
+        # WHEN
+        adaptor._handle_license_error(match)
+        first_exc_info = adaptor._exc_info
+        adaptor._handle_license_error(match)
+
+        # THEN
+        mock_disk_usage.assert_called_once()
+        assert adaptor._exc_info is first_exc_info
+
+    @patch.object(adaptor_module.shutil, "disk_usage")
+    def test_license_error_reported_with_strict_error_checking(
+        self, mock_disk_usage: Mock, init_data: dict
+    ) -> None:
+        """
+        Tests that the license error replaces the generic strict error checking error, which also
+        matches the line, and that repeats of the line keep it without checking the disk again
+        """
+        # GIVEN
+        init_data["strict_error_checking"] = True
+        adaptor = MayaAdaptor(init_data)
+        handler = adaptor_module._MayaRegexHandler(adaptor._get_regex_callbacks())
+        msg = (
+            "RuntimeError: Error encountered when initializing Maya - "
+            "Please check for sufficient disk space "
+            "and necessary write permissions of MAYA_APP_DIR."
+        )
+        Usage = namedtuple("Usage", ["total", "used", "free"])
+        mock_disk_usage.return_value = Usage(0, 0, 0)
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, msg, None, None)
+
+        # WHEN
+        handler.emit(record)
+        first_exc_info = adaptor._exc_info
+        handler.emit(record)
+
+        # THEN
+        assert str(first_exc_info).startswith(
+            f"{msg}\nThis error is typically associated with a licensing error"
+        )
+        assert "MAYA_APP_DIR: " in str(first_exc_info)
+        mock_disk_usage.assert_called_once()
+        assert adaptor._exc_info is first_exc_info
+
     @pytest.mark.parametrize("strict_error_checking", [True, False])
     def test_strict_error_checking(self, init_data: dict, strict_error_checking: bool) -> None:
         """
@@ -843,7 +1093,7 @@ class TestMayaAdaptor_on_cleanup:
         # GIVEN
         init_data["strict_error_checking"] = strict_error_checking
         adaptor = MayaAdaptor(init_data)
-        error_regexes = [re.compile(".*Exception:.*|.*Error:.*|.*Warning.*|.*SEVERE.*")]
+        error_regexes = [re.compile("^.*(?:Exception:|Error:|Warning|SEVERE).*")]
 
         # WHEN
         callbacks = adaptor._get_regex_callbacks()
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from typing import Any
+from unittest.mock import Mock, call, patch
 
+import maya.cmds
 import pytest
 
 from deadline.maya_adaptor.MayaClient.render_handlers.arnold_handler import ArnoldHandler
@@ -47,3 +49,30 @@ class TestArnoldHandler:
 
         # THEN
         assert handler.render_kwargs["width"] == args["image_width"]
+
+    @patch.object(maya.cmds, "arnoldRender", create=True)
+    @patch.object(maya.cmds, "getAttr", return_value=0)
+    @patch.object(maya.cmds, "setAttr")
+    @patch.object(ArnoldHandler, "get_camera_to_render", return_value="camera1")
+    def test_start_render_sets_render_options_once(
+        self,
+        mock_get_camera: Mock,
+        mock_set_attr: Mock,
+        mock_get_attr: Mock,
+        mock_arnold_render: Mock,
+    ) -> None:
+        """Tests that the render options are only set for the first frame rendered in a scene"""
+        # GIVEN
+        handler = ArnoldHandler()
+        handler.render_kwargs.update(width=1920, height=1080)
+
+        # WHEN
+        for frame in range(3):
+            handler.start_render({"frame": frame})
+
+        # THEN
+        assert mock_arnold_render.call_count == 3
+        assert mock_set_attr.call_args_list == [
+            call("defaultArnoldRenderOptions.renderType", 0),
+            call("defaultArnoldRenderOptions.log_verbosity", 2),
+        ]
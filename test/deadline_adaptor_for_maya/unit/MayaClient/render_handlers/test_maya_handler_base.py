@@ -3,10 +3,14 @@ from __future__ import annotations
 
 from unittest.mock import Mock, patch
 
+import maya.cmds
 import pytest
 
 from deadline.maya_adaptor.MayaClient.dir_map import DirectoryMapping, DirectoryMappingDict
-from deadline.maya_adaptor.MayaClient.render_handlers import DefaultMayaHandler
+from deadline.maya_adaptor.MayaClient.render_handlers import (
+    DefaultMayaHandler,
+    default_maya_handler,
+)
 
 
 @pytest.fixture()
@@ -84,3 +88,137 @@ class TestDefaultMayaHandler:
         # THEN
         mock_mapping_activated.assert_called_once_with(True)
         assert mock_set_mappings.call_count == len(args["path_mapping_rules"])
+
+    @patch.object(maya.cmds, "getAttr", return_value=True)
+    @patch.object(maya.cmds, "listRelatives", return_value=["cameraShape1"])
+    @patch.object(maya.cmds, "ls", side_effect=lambda name, transforms: [name])
+    def test_get_camera_to_render_validates_once(
+        self,
+        mock_ls: Mock,
+        mock_list_relatives: Mock,
+        mock_get_attr: Mock,
+        mayahandlerbase: DefaultMayaHandler,
+    ):
+        """
+        Tests that the camera is only looked up in the scene again after the camera changes
+        """
+        # GIVEN
+        mayahandlerbase.set_camera({"camera": "camera1"})
+
+        # WHEN
+        for frame in range(3):
+            assert mayahandlerbase.get_camera_to_render({"frame": frame}) == "camera1"
+
+        # THEN
+        mock_ls.assert_called_once_with("camera1", transforms=True)
+        mock_list_relatives.assert_called_once_with("camera1", shapes=True, type="camera")
+        mock_get_attr.assert_called_once_with("camera1.renderable")
+
+        # WHEN
+        mayahandlerbase.set_camera({"camera": "persp"})
+        camera = mayahandlerbase.get_camera_to_render({"frame": 3})
+
+        # THEN
+        assert camera == "persp"
+        assert mock_ls.call_count == 2
+        mock_get_attr.assert_called_with("persp.renderable")
+
+    @patch.object(maya.cmds, "getAttr", return_value=False)
+    @patch.object(maya.cmds, "listRelatives", return_value=["cameraShape1"])
+    @patch.object(maya.cmds, "ls", return_value=["camera1"])
+    def test_get_camera_to_render_not_renderable(
+        self,
+        mock_ls: Mock,
+        mock_list_relatives: Mock,
+        mock_get_attr: Mock,
+        mayahandlerbase: DefaultMayaHandler,
+    ):
+        """
+        Tests that a camera that fails validation is checked again on the next call
+        """
+        # GIVEN
+        mayahandlerbase.set_camera({"camera": "camera1"})
+
+        # WHEN
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="is not renderable"):
+                mayahandlerbase.get_camera_to_render({"frame": 1})
+
+        # THEN
+        assert mock_get_attr.call_count == 2
+
+    @pytest.mark.parametrize(
+        "matches, camera_shapes",
+        [
+            ([], None),
+            (["|group1|camera1", "|group2|camera1"], ["cameraShape1"]),
+            (["camera1"], None),
+        ],
+    )
+    @patch.object(maya.cmds, "listRelatives")
+    @patch.object(maya.cmds, "ls")
+    def test_get_camera_to_render_does_not_exist(
+        self,
+        mock_ls: Mock,
+        mock_list_relatives: Mock,
+        matches: list[str],
+        camera_shapes: list[str] | None,
+        mayahandlerbase: DefaultMayaHandler,
+    ):
+        """
+        Tests that a camera is only found when its name resolves to one transform with a camera
+        shape, whether the name is missing, ambiguous or not a camera
+        """
+        # GIVEN
+        mock_ls.return_value = matches
+        mock_list_relatives.return_value = camera_shapes
+
+        # WHEN / THEN
+        with pytest.raises(RuntimeError, match="'camera1', does not exist"):
+            mayahandlerbase.get_camera_to_render({"camera": "camera1"})
+
+    @patch.object(
+        default_maya_handler, "_get_render_layer_display_name", side_effect=lambda name: name[3:]
+    )
+    @patch.object(maya.cmds, "referenceQuery", side_effect=lambda name, **_: name == "rs_ref")
+    @patch.object(maya.cmds, "ls", return_value=["rs_ref", "rs_layer1", "rs_layer2", "rs_layer3"])
+    def test_get_render_layer_to_render(
+        self,
+        mock_ls: Mock,
+        mock_reference_query: Mock,
+        mock_display_name: Mock,
+        mayahandlerbase: DefaultMayaHandler,
+    ):
+        """
+        Tests that the layers after the requested one are not looked at, and that every
+        non-referenced layer is reported when the requested one is missing
+        """
+        # WHEN
+        render_layer = mayahandlerbase.get_render_layer_to_render({"render_layer": "layer2"})
+
+        # THEN
+        assert render_layer == "rs_layer2"
+        assert [c.args[0] for c in mock_display_name.call_args_list] == ["rs_layer1", "rs_layer2"]
+
+        # WHEN / THEN
+        with pytest.raises(RuntimeError, match=r"\['layer1', 'layer2', 'layer3'\]"):
+            mayahandlerbase.get_render_layer_to_render({"render_layer": "missing"})
+
+    @patch.object(maya.cmds, "getAttr", return_value="")
+    @patch.object(maya.cmds, "file")
+    @patch("os.path.isfile", return_value=True)
+    def test_set_scene_file(
+        self,
+        mock_isfile: Mock,
+        mock_file: Mock,
+        mock_get_attr: Mock,
+        mayahandlerbase: DefaultMayaHandler,
+    ):
+        """
+        Tests that the scene is opened without prompting
+        """
+        # WHEN
+        mayahandlerbase.set_scene_file({"scene_file": "/scenes/scene.mb"})
+
+        # THEN
+        mock_file.assert_called_once_with("/scenes/scene.mb", open=True, force=True, prompt=False)
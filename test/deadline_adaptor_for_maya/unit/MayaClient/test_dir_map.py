@@ -1,5 +1,9 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+from unittest.mock import patch
+
+import maya.cmds
+
 from deadline.maya_adaptor.MayaClient.dir_map import DirectoryMapping, DirectoryMappingDict
 
 
@@ -16,6 +20,24 @@ class TestDirectoryMappingDict:
         dict_obj = DirectoryMappingDict()
         assert str(dict_obj) == "DirectoryMappingDict"
 
+    @patch.object(maya.cmds, "dirmap", return_value=["/src/a", "/dest/a", "/src/b", "/dest/b"])
+    def test_items_keys_values(self, mock_dirmap):
+        """Test that the flat mapping list is split into sources, destinations and pairs"""
+        dict_obj = DirectoryMappingDict()
+
+        assert dict_obj.items() == [("/src/a", "/dest/a"), ("/src/b", "/dest/b")]
+        assert dict_obj.keys() == ["/src/a", "/src/b"]
+        assert dict_obj.values() == ["/dest/a", "/dest/b"]
+        assert list(dict_obj) == ["/src/a", "/src/b"]
+
+    @patch.object(maya.cmds, "dirmap", return_value=None)
+    def test_items_no_mappings(self, mock_dirmap):
+        """Test that no mappings gives empty results"""
+        dict_obj = DirectoryMappingDict()
+
+        assert dict_obj.items() == []
+        assert dict_obj.keys() == []
+
 
 class TestDirectoryMapping:
     def test_mappings_is_mapping_dict(self):
@@ -2,6 +2,7 @@
 
 import os
 import re
+import sys
 from collections import namedtuple
 from typing import Any
 from unittest.mock import Mock, call, patch
@@ -34,6 +35,17 @@ def test_reload_modules(mock_reload: Mock) -> None:
     mock_reload.assert_has_calls([call(module) for module in modules], any_order=True)
 
 
+@patch.object(DeadlineCloudForMaya, "reload")
+def test_reload_modules_once_each_children_first(mock_reload: Mock) -> None:
+    # WHEN
+    DeadlineCloudForMaya.reload_modules(deadline.maya_submitter)
+
+    # THEN every module is reloaded once, and the package itself last
+    reloaded = [c.args[0] for c in mock_reload.call_args_list]
+    assert len(reloaded) == len({module.__name__ for module in reloaded})
+    assert reloaded[-1] is deadline.maya_submitter
+
+
 @patch.object(om.MGlobal, "mayaState")
 @patch.object(om, "MFnPlugin")
 @patch.object(DeadlineCloudForMaya, "reload")
@@ -82,6 +94,26 @@ def test_initialize_and_uninitialize_plugin(
     plugin_obj.deregisterCommand.assert_called_once_with("DeadlineCloudSubmitter")
 
 
+@patch.object(om.MGlobal, "mayaState", return_value=om.MGlobal.kBatch)
+@patch.object(om, "MFnPlugin")
+@patch.object(DeadlineCloudForMaya, "reload_modules")
+def test_initialize_plugin_reloads_loaded_packages(
+    mock_reload_modules: Mock, mock_MFnPlugin: Mock, mock_mayaState: Mock
+) -> None:
+    # GIVEN the submitter was never opened, so deadline.job_attachments was not imported
+    with patch.object(DeadlineCloudForMaya, "_first_initialization", False):
+        with patch.dict(sys.modules, {"deadline.job_attachments": None}):
+            # WHEN
+            DeadlineCloudForMaya.initializePlugin(Mock())
+
+    # THEN
+    assert mock_reload_modules.call_args_list == [
+        call(sys.modules["deadline.client"]),
+        call(sys.modules["deadline.maya_submitter"]),
+    ]
+    DeadlineCloudForMaya.uninitializePlugin(Mock())
+
+
 @patch.object(maya.cmds, "confirmDialog")
 @patch.object(
     DeadlineCloudForMaya,
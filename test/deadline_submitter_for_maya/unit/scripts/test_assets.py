@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from collections import namedtuple
 from os.path import normpath, split
@@ -75,74 +76,183 @@ class TestSceneIntrospection:
 
 
 @patch.object(utils_module, "_patternToRegex")
-@patch("os.path.isdir")
-@patch("os.path.isfile")
-@patch("os.listdir")
+@patch("os.scandir", wraps=os.scandir)
 def test_expand_path_caching(
-    mock_listdir: Mock,
-    mock_isfile: Mock,
-    mock_isdir: Mock,
+    mock_scandir: Mock,
     mock_pattern_to_regex: Mock,
+    tmp_path: Path,
 ):
-    """A test that verifies the lru cache returns an exhausted generator
+    """A test that verifies the lru cache returns the same expanded paths
     if we've already expanded the input path.
 
     This behaviour gives us performance improvements since subsequent work
     that would check if the cached files exist is completely skipped"""
     # GIVEN
-    path = Path("/test/file/path.png")
-    mock_isfile.return_value = True
-    mock_isdir.return_value = True
-    mock_listdir.return_value = [path.name]
+    path = tmp_path / "path.png"
+    path.touch()
     mock_pattern_to_regex.return_value = path.name
     asset_introspector = assets_module.AssetIntrospector()
+    asset_introspector._expand_path.cache_clear()
 
     # WHEN
     first_result = asset_introspector._expand_path(str(path))
 
     # THEN
-    assert next(first_result) == path
-    with pytest.raises(StopIteration):
-        next(first_result)
+    assert first_result == (path,)
+    scandir_calls = mock_scandir.call_count
 
     # WHEN
     second_result = asset_introspector._expand_path(str(path))
 
     # THEN
-    with pytest.raises(StopIteration):
-        next(second_result)
+    assert second_result == (path,)
     assert first_result is second_result
+    assert mock_scandir.call_count == scandir_calls
 
     # WHEN
     asset_introspector._expand_path.cache_clear()
     third_result = asset_introspector._expand_path(str(path))
 
     # THEN
-    assert next(third_result) == path
+    assert third_result == (path,)
+    assert mock_scandir.call_count > scandir_calls
+
+
+@pytest.mark.parametrize(
+    "path, expected_paths",
+    [
+        ("/tex/file.####.png", ["/tex/file.0009.png", "/tex/file.0010.png"]),
+        ("/tex/{name}.##.####.png", ["/tex/{name}.09.0009.png", "/tex/{name}.10.0010.png"]),
+        ("/tex/file.png", ["/tex/file.png"]),
+    ],
+)
+@patch.object(assets_module, "findAllFilesForPattern", return_value=[])
+@patch.object(assets_module.Animation, "frame_list", return_value=[9, 10])
+def test_expand_path_frame_padding(
+    mock_frame_list: Mock,
+    mock_find_all_files: Mock,
+    path: str,
+    expected_paths: list[str],
+):
+    """Tests that each run of '#' is replaced with the frame number padded to the run's length"""
+    # GIVEN
+    asset_introspector = assets_module.AssetIntrospector()
+    asset_introspector._expand_path.cache_clear()
+
+    # WHEN
+    asset_introspector._expand_path(path)
+
+    # THEN
+    assert [c.args[0] for c in mock_find_all_files.call_args_list] == expected_paths
+
+
+@patch.object(assets_module, "findAllFilesForPattern", return_value=[])
+@patch.object(assets_module.Animation, "frame_list", return_value=[1, 2])
+def test_expand_path_reads_frames_once(mock_frame_list: Mock, mock_find_all_files: Mock):
+    """Tests that the scene's frames are read once for all of the animated paths"""
+    # GIVEN
+    asset_introspector = assets_module.AssetIntrospector()
+    asset_introspector._expand_path.cache_clear()
+
+    # WHEN
+    asset_introspector._expand_path("/tex/file1.#.png")
+    asset_introspector._expand_path("/tex/file2.<f>.png")
+    asset_introspector._expand_path("/tex/file3.png")
+
+    # THEN
+    mock_frame_list.assert_called_once_with()
+    assert mock_find_all_files.call_count == 5
+
+
+@patch.object(assets_module.Scene, "name", return_value="/scenes/scene.mb")
+@patch.object(assets_module.Scene, "renderer", return_value="mayaSoftware")
+@patch.object(assets_module.AssetIntrospector, "_get_yeti_files", return_value=set())
+@patch.object(assets_module.FilePathEditor, "fileRefs")
+@patch.object(assets_module.AssetIntrospector, "_expand_path")
+def test_parse_scene_assets_skips_duplicate_refs(
+    mock_expand_path: Mock,
+    mock_file_refs: Mock,
+    mock_get_yeti_files: Mock,
+    mock_renderer: Mock,
+    mock_name: Mock,
+):
+    """Tests that a file referenced by several nodes is only searched for once"""
+    # GIVEN
+    mock_expand_path.cache_clear = Mock()
+    mock_expand_path.side_effect = lambda path: (Path(path),)
+    mock_file_refs.return_value = [
+        Mock(path="/tex/file1.png"),
+        Mock(path="/tex/./file1.png"),
+        Mock(path="/tex/file2.png"),
+    ]
+
+    # WHEN
+    result = assets_module.AssetIntrospector().parse_scene_assets()
+
+    # THEN
+    assert [c.args[0] for c in mock_expand_path.call_args_list] == [
+        normpath("/tex/file1.png"),
+        normpath("/tex/file2.png"),
+    ]
+    assert result == {
+        Path(normpath("/tex/file1.png")),
+        Path(normpath("/tex/file2.png")),
+        Path("/scenes/scene.mb"),
+    }
+    mock_renderer.assert_called_once_with()
+
+
+@patch.object(assets_module, "findAllFilesForPattern", side_effect=lambda path, frame: [path])
+@patch.object(assets_module.Animation, "frame_list", return_value=[1, 2])
+@patch.object(assets_module.Scene, "name", return_value="/scenes/scene.mb")
+@patch.object(assets_module.Scene, "renderer", return_value="mayaSoftware")
+@patch.object(assets_module.AssetIntrospector, "_get_yeti_files", return_value=set())
+@patch.object(assets_module.FilePathEditor, "fileRefs")
+@patch.object(assets_module, "ThreadPoolExecutor", wraps=assets_module.ThreadPoolExecutor)
+def test_parse_scene_assets_shares_executor(
+    mock_executor: Mock,
+    mock_file_refs: Mock,
+    mock_get_yeti_files: Mock,
+    mock_renderer: Mock,
+    mock_name: Mock,
+    mock_frame_list: Mock,
+    mock_find_all_files: Mock,
+):
+    """Tests that one thread pool searches the frames of every animated path in a parse"""
+    # GIVEN
+    mock_file_refs.return_value = [Mock(path="/tex/file1.#.png"), Mock(path="/tex/file2.#.png")]
+    asset_introspector = assets_module.AssetIntrospector()
+
+    # WHEN
+    result = asset_introspector.parse_scene_assets()
+
+    # THEN
+    mock_executor.assert_called_once()
+    assert asset_introspector._executor is None
+    assert result == {
+        Path(normpath("/tex/file1.1.png")),
+        Path(normpath("/tex/file1.2.png")),
+        Path(normpath("/tex/file2.1.png")),
+        Path(normpath("/tex/file2.2.png")),
+        Path("/scenes/scene.mb"),
+    }
 
 
 @patch.object(utils_module, "_patternToRegex")
-@patch("os.path.isdir")
-@patch("os.path.isfile")
-@patch("os.listdir")
 @patch("maya.cmds")
 def test_get_tex_files(
     mock_cmds: Mock,
-    mock_listdir: Mock,
-    mock_isfile: Mock,
-    mock_isdir: Mock,
     mock_pattern_to_regex: Mock,
+    tmp_path: Path,
 ):
     # A test that verifies the logic for renderman tex file discovery
 
     # GIVEN
-    path = "/tmp/"
+    path = str(tmp_path) + os.sep
     basename = "mytexture1.exr"
     tex_suffix = ".srgb_acescg.tex"
-    mock_pattern_to_regex.return_value = path + basename
-    mock_isfile.return_value = True
-    mock_isdir.return_value = True
-    mock_listdir.return_value = [path + basename]
+    mock_pattern_to_regex.return_value = basename
+    (tmp_path / basename).touch()
 
     # python 3.9 3.10 requires to mock the import of maya.cmds
     sys.modules["maya.cmds"] = mock_cmds
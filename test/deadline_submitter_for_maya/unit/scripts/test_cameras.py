@@ -0,0 +1,67 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+import deadline.maya_submitter.cameras as cameras_module
+
+
+@pytest.mark.parametrize(
+    "renderable, expected",
+    [
+        ({"persp": False, "camera1": False, "camera2": False}, False),
+        ({"persp": False, "camera1": True, "camera2": False}, False),
+        ({"persp": True, "camera1": True, "camera2": True}, True),
+    ],
+)
+@patch.object(cameras_module.maya.cmds, "getAttr")
+@patch.object(cameras_module.maya.cmds, "listRelatives")
+@patch.object(cameras_module.maya.cmds, "ls")
+def test_has_multiple_renderable_cameras(
+    mock_ls: Mock,
+    mock_list_relatives: Mock,
+    mock_get_attr: Mock,
+    renderable: dict[str, bool],
+    expected: bool,
+) -> None:
+    # GIVEN
+    mock_list_relatives.return_value = list(renderable)
+    mock_get_attr.side_effect = lambda attr: renderable[attr.split(".")[0]]
+
+    # WHEN
+    result = cameras_module.has_multiple_renderable_cameras()
+
+    # THEN
+    assert result == expected
+    assert result == (len(cameras_module.get_renderable_camera_names()) > 1)
+
+
+@patch.object(cameras_module.maya.cmds, "getAttr", return_value=True)
+@patch.object(cameras_module.maya.cmds, "listRelatives")
+@patch.object(cameras_module.maya.cmds, "ls")
+def test_has_multiple_renderable_cameras_stops_early(
+    mock_ls: Mock, mock_list_relatives: Mock, mock_get_attr: Mock
+) -> None:
+    # GIVEN
+    mock_list_relatives.return_value = ["persp", "camera1", "camera2", "camera3"]
+
+    # WHEN
+    result = cameras_module.has_multiple_renderable_cameras()
+
+    # THEN
+    assert result
+    assert mock_get_attr.call_count == 2
+
+
+@patch.object(cameras_module.maya.cmds, "listRelatives", return_value=None)
+@patch.object(cameras_module.maya.cmds, "ls", return_value=[])
+def test_get_renderable_camera_names_no_cameras(mock_ls: Mock, mock_list_relatives: Mock) -> None:
+    # WHEN
+    camera_names = cameras_module.get_renderable_camera_names()
+
+    # THEN
+    assert camera_names == []
+    assert not cameras_module.has_multiple_renderable_cameras()
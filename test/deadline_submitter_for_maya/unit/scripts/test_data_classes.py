@@ -0,0 +1,51 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from deadline.maya_submitter.data_classes import (
+    RENDER_SUBMITTER_SETTINGS_FILE_EXT,
+    RenderSubmitterUISettings,
+)
+
+
+def test_sticky_settings_round_trip(tmp_path: Path):
+    """Tests that only the sticky settings are saved, and that they are loaded back"""
+    # GIVEN
+    scene_filename = str(tmp_path / "scene.mb")
+    settings = RenderSubmitterUISettings(
+        name="My Job",
+        frame_list="1-10",
+        input_filenames=["/tex/file1.png"],
+        project_path="/not/sticky",
+    )
+
+    # WHEN
+    settings.save_sticky_settings(scene_filename)
+
+    # THEN
+    saved = json.loads(
+        (tmp_path / "scene.mb").with_suffix(RENDER_SUBMITTER_SETTINGS_FILE_EXT).read_text()
+    )
+    assert list(saved) == [
+        "name",
+        "description",
+        "override_frame_range",
+        "frame_list",
+        "input_filenames",
+        "input_directories",
+        "output_directories",
+        "include_adaptor_wheels",
+    ]
+
+    # WHEN
+    loaded = RenderSubmitterUISettings()
+    loaded.load_sticky_settings(scene_filename)
+
+    # THEN
+    assert loaded.name == "My Job"
+    assert loaded.frame_list == "1-10"
+    assert loaded.input_filenames == ["/tex/file1.png"]
+    assert loaded.project_path == ""
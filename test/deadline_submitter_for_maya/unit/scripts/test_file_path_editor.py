@@ -0,0 +1,71 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+import deadline.maya_submitter.file_path_editor as file_path_editor_module
+from deadline.maya_submitter.file_path_editor import FilePathEditor, FileRef
+
+
+@patch.object(file_path_editor_module.maya.cmds, "getAttr", return_value="/tex/file1.png")
+@patch.object(file_path_editor_module.maya.cmds, "filePathEditor")
+def test_file_refs(mock_file_path_editor: Mock, mock_get_attr: Mock):
+    """Tests that each [path, attribute, exists] block becomes a file reference"""
+    # GIVEN
+    mock_file_path_editor.side_effect = lambda **kwargs: (
+        [
+            "file1.png",
+            "file1.fileTextureName",
+            "1",
+            "scene.abc",
+            "cache1.cacheFileName",
+            "0",
+        ]
+        if "listFiles" in kwargs
+        else None
+    )
+
+    # WHEN
+    refs = FilePathEditor.fileRefs(["/tex"])
+
+    # THEN
+    assert refs == [
+        FileRef(os.path.join("/tex", "file1.png"), True),
+        FileRef(os.path.join("/tex", "scene.abc"), False),
+    ]
+
+
+@patch.object(file_path_editor_module.maya.cmds, "getAttr")
+@patch.object(file_path_editor_module.maya.cmds, "filePathEditor")
+def test_file_refs_texture_pattern(mock_file_path_editor: Mock, mock_get_attr: Mock):
+    """Tests that a multi-tiled texture is referenced by its pattern, read from Maya once"""
+    # GIVEN
+    mock_file_path_editor.return_value = ["file1.1001.png", "file1.fileTextureName", "1"]
+    mock_get_attr.side_effect = {
+        "file1.fileTextureName": "/tex/file1.1001.png",
+        "file1.computedFileTextureNamePattern": "/tex/file1.<UDIM>.png",
+    }.get
+
+    # WHEN
+    refs = FilePathEditor.fileRefs(["/tex"])
+
+    # THEN
+    assert refs == [FileRef("/tex/file1.<UDIM>.png", True)]
+    assert mock_get_attr.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("1", True), ("True", True), ("on", True), ("0", False), ("false", False), ("OFF", False)],
+)
+def test_str_to_bool(value: str, expected: bool):
+    assert file_path_editor_module._str_to_bool(value) is expected
+
+
+def test_str_to_bool_invalid():
+    with pytest.raises(ValueError, match="invalid truth value 'maybe'"):
+        file_path_editor_module._str_to_bool("maybe")
@@ -0,0 +1,39 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import logging
+from unittest.mock import patch
+
+import deadline.maya_submitter.logging as logging_module
+from deadline.maya_submitter.logging import get_logger
+
+
+def test_get_logger_shares_handlers():
+    """Tests that every submitter logger writes through the same handlers"""
+    # WHEN
+    first_logger = get_logger("test_get_logger_shares_handlers.first")
+    second_logger = get_logger("test_get_logger_shares_handlers.second")
+
+    # THEN
+    assert len(first_logger.handlers) == 2
+    assert all(
+        first is second for first, second in zip(first_logger.handlers, second_logger.handlers)
+    )
+    assert not first_logger.propagate
+
+
+def test_console_handler_shows_debug_records():
+    """Tests that debug records reach the script editor when the logger is set to debug"""
+    # GIVEN
+    logger = get_logger("test_console_handler_shows_debug_records")
+    _, disk_handler = logger.handlers
+    logger.setLevel(logging.DEBUG)
+
+    # WHEN
+    with patch.object(logging_module, "om") as mock_om:
+        with patch.object(disk_handler, "emit") as mock_disk_emit:
+            logger.debug("debug message")
+
+    # THEN
+    mock_om.MGlobal.displayInfo.assert_called_once()
+    assert "debug message" in mock_om.MGlobal.displayInfo.call_args.args[0]
+    mock_disk_emit.assert_called_once()
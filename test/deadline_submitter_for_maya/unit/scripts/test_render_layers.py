@@ -0,0 +1,60 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+import deadline.maya_submitter.render_layers as render_layers_module
+
+
+@pytest.mark.parametrize(
+    "current_layers, expected_restore_calls",
+    [
+        (["defaultRenderLayer", "defaultRenderLayer"], 0),
+        (["defaultRenderLayer", "rs_layer1"], 1),
+    ],
+)
+@patch.object(render_layers_module.maya.cmds, "editRenderLayerGlobals")
+def test_saved_current_render_layer(
+    mock_edit_render_layer_globals: Mock,
+    current_layers: list[str],
+    expected_restore_calls: int,
+) -> None:
+    """Tests that the saved layer is only switched back to when the block changed it"""
+    # GIVEN
+    mock_edit_render_layer_globals.side_effect = current_layers + [None]
+
+    # WHEN
+    with render_layers_module.saved_current_render_layer() as saved_layer_name:
+        pass
+
+    # THEN
+    assert saved_layer_name == "defaultRenderLayer"
+    restore_calls = [
+        c
+        for c in mock_edit_render_layer_globals.call_args_list
+        if c.kwargs == {"currentRenderLayer": "defaultRenderLayer"}
+    ]
+    assert len(restore_calls) == expected_restore_calls
+
+
+@patch.object(
+    render_layers_module.maya.cmds, "getAttr", side_effect=lambda attr: attr != "off.renderable"
+)
+@patch.object(
+    render_layers_module.maya.cmds, "referenceQuery", side_effect=lambda name, **_: name == "ref"
+)
+@patch.object(render_layers_module.maya.cmds, "ls", return_value=["ref", "layer1", "off", "layer2"])
+def test_get_all_renderable_render_layer_names(
+    mock_ls: Mock, mock_reference_query: Mock, mock_get_attr: Mock
+) -> None:
+    """Tests that referenced and non-renderable layers are filtered out"""
+    # WHEN
+    render_layer_names = render_layers_module.get_all_renderable_render_layer_names()
+
+    # THEN
+    assert render_layer_names == ["layer1", "layer2"]
+    # The renderable attribute of a referenced layer is never read
+    assert mock_get_attr.call_count == 3
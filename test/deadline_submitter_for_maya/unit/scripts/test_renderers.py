@@ -0,0 +1,74 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+import deadline.maya_submitter.renderers as renderers_module
+
+
+@pytest.mark.parametrize(
+    "prefix, multiple_cameras, multiple_layers, expected",
+    [
+        ("", False, False, "<Scene>"),
+        ("", True, False, "<Camera>/<Scene>"),
+        ("", False, True, "<Layer>/<Scene>"),
+        ("", True, True, "<Layer>/<Camera>/<Scene>"),
+        ("<RenderLayer>/%c/<Scene>", True, True, "<RenderLayer>/%c/<Scene>"),
+        ("%l/<Camera>/<Scene>", True, True, "%l/<Camera>/<Scene>"),
+        ("<Layer>_<Scene>", True, True, "<Camera>/<Layer>_<Scene>"),
+        ("renders/<Scene>", True, True, "<Layer>/<Camera>/renders/<Scene>"),
+    ],
+)
+@patch.object(renderers_module, "get_all_renderable_render_layer_names")
+@patch.object(renderers_module, "has_multiple_renderable_cameras")
+@patch.object(renderers_module.maya.cmds, "getAttr")
+def test_get_output_prefix_with_tokens(
+    mock_get_attr: Mock,
+    mock_has_multiple_renderable_cameras: Mock,
+    mock_get_all_renderable_render_layer_names: Mock,
+    prefix: str,
+    multiple_cameras: bool,
+    multiple_layers: bool,
+    expected: str,
+) -> None:
+    # GIVEN
+    mock_get_attr.return_value = prefix
+    mock_has_multiple_renderable_cameras.return_value = multiple_cameras
+    mock_get_all_renderable_render_layer_names.return_value = (
+        ["layer1", "layer2"] if multiple_layers else ["layer1"]
+    )
+
+    # WHEN
+    result = renderers_module.get_output_prefix_with_tokens()
+
+    # THEN
+    assert result == expected
+
+
+@pytest.mark.parametrize("prefix", ["<Scene>", "<Layer>/<Scene>"])
+@pytest.mark.parametrize("multiple_render_layers", [True, False])
+@patch.object(renderers_module, "get_all_renderable_render_layer_names")
+@patch.object(renderers_module, "has_multiple_renderable_cameras", return_value=False)
+@patch.object(renderers_module.maya.cmds, "getAttr")
+def test_get_output_prefix_with_tokens_given_layer_count(
+    mock_get_attr: Mock,
+    mock_has_multiple_renderable_cameras: Mock,
+    mock_get_all_renderable_render_layer_names: Mock,
+    multiple_render_layers: bool,
+    prefix: str,
+) -> None:
+    """Tests that the render layers are not queried again when the caller knows their count"""
+    # GIVEN
+    mock_get_attr.return_value = prefix
+
+    # WHEN
+    result = renderers_module.get_output_prefix_with_tokens(
+        multiple_render_layers=multiple_render_layers
+    )
+
+    # THEN
+    mock_get_all_renderable_render_layer_names.assert_not_called()
+    assert result.startswith("<Layer>/") == (multiple_render_layers or prefix.startswith("<Layer>"))
@@ -1,11 +1,15 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import sys
 from typing import Optional
+from unittest.mock import MagicMock, Mock, patch
 
+import maya.cmds
 import pytest
 
 from deadline.maya_submitter.scene import (
     FrameRange,
+    Scene,
 )
 
 
@@ -27,6 +31,18 @@ class TestFrameRange:
             step = 1
         assert frames == [i for i in range(start, stop + step, step)]
 
+    @pytest.mark.parametrize("start, stop, step", frame_range_params)
+    def test_frame_range_len_and_contains(self, start: int, stop: int, step: Optional[int]) -> None:
+        # GIVEN
+        frame_range = FrameRange(start, stop, step)
+        frames = [f for f in frame_range]
+
+        # THEN
+        assert len(frame_range) == len(frames)
+        assert all(frame in frame_range for frame in frames)
+        assert frames[-1] + 1 not in frame_range
+        assert start - 1 not in frame_range
+
     @pytest.mark.parametrize("start, stop, step", frame_range_params)
     def test_frame_repr(self, start: int, stop: int, step: Optional[int]) -> None:
         # GIVEN
@@ -42,3 +58,20 @@ class TestFrameRange:
             assert fr_repr == f"{start}-{stop}"
         else:
             assert fr_repr == f"{start}-{stop}:{step}"
+
+
+class TestScene:
+    @pytest.mark.parametrize("options_exist", [True, False])
+    @patch.object(maya.cmds, "objExists")
+    def test_ensure_arnold_options_loaded(self, mock_obj_exists: Mock, options_exist: bool) -> None:
+        # GIVEN
+        mock_obj_exists.return_value = options_exist
+        mock_mtoa_core = MagicMock()
+
+        # WHEN
+        with patch.dict(sys.modules, {"mtoa": MagicMock(), "mtoa.core": mock_mtoa_core}):
+            Scene.ensure_arnold_options_loaded()
+
+        # THEN the options are only created when they do not exist yet
+        mock_obj_exists.assert_called_once_with("defaultArnoldRenderOptions")
+        assert mock_mtoa_core.createOptions.called != options_exist
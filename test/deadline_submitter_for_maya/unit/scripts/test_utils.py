@@ -1,10 +1,22 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import os
 import re
+from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
+import yaml  # type: ignore[import]
+from deadline.client.job_bundle._yaml import deadline_yaml_dump
 
-from deadline.maya_submitter.utils import join_paths, timed_func
+from deadline import maya_submitter
+import deadline.maya_submitter.utils as utils_module
+from deadline.maya_submitter.utils import (
+    findAllFilesForPattern,
+    join_paths,
+    timed_func,
+    yaml_dump,
+)
 
 
 def test_timed_func(capsys):
@@ -60,3 +72,57 @@ def test_timed_func(capsys):
 def test_join_paths(first_path: str, second_path: str, expected_output: str):
     """Basic test to ensure backslash paths are replaced"""
     assert join_paths(first_path, second_path) == expected_output
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"name": "Job", "description": "first line\nsecond line\n", "steps": [{"a": 1}]},
+        yaml.safe_load(
+            (Path(maya_submitter.__file__).parent / "default_maya_job_template.yaml").read_text()
+        ),
+    ],
+)
+def test_yaml_dump_matches_deadline_yaml_dump(data: dict):
+    """Tests that the libyaml backed dump writes the same document as deadline_yaml_dump"""
+    # WHEN
+    result = yaml_dump(data, indent=1)
+
+    # THEN
+    assert result == deadline_yaml_dump(data, indent=1)
+    assert yaml.safe_load(result) == data
+
+
+@patch.object(utils_module, "_patternToRegex", side_effect=lambda pattern: pattern)
+def test_find_all_files_for_pattern(mock_pattern_to_regex: Mock, tmp_path: Path):
+    """Tests that only files matching the pattern are found, ignoring case"""
+    # GIVEN
+    (tmp_path / "file.0001.png").touch()
+    (tmp_path / "FILE.0002.png").touch()
+    (tmp_path / "other.0001.png").touch()
+    (tmp_path / "file.0003.png").mkdir()
+
+    # WHEN
+    result = findAllFilesForPattern(str(tmp_path / "file.[0-9]+.png"), 1)
+
+    # THEN
+    assert sorted(result) == [
+        os.path.join(tmp_path, "FILE.0002.png"),
+        os.path.join(tmp_path, "file.0001.png"),
+    ]
+
+
+@pytest.mark.parametrize("directory", ["missing", "not_a_directory"])
+@patch.object(utils_module, "_patternToRegex", side_effect=lambda pattern: pattern)
+def test_find_all_files_for_pattern_no_directory(
+    mock_pattern_to_regex: Mock, directory: str, tmp_path: Path
+):
+    """Tests that nothing is found when the pattern's directory is not a directory"""
+    # GIVEN
+    (tmp_path / "not_a_directory").touch()
+
+    # WHEN
+    result = findAllFilesForPattern(str(tmp_path / directory / "file.png"), 1)
+
+    # THEN
+    assert result == []